@@ -0,0 +1,339 @@
+"""
+Suíte de benchmarks com curvas de escala para as 4 perguntas
+
+Para cada caso mede, em tamanhos de entrada crescentes, o tempo (melhor de
+várias repetições) e o pico de memória (tracemalloc, em uma execução à parte).
+Também estima o expoente de escala (t ~ n^k) entre tamanhos consecutivos,
+o que permite detectar, por exemplo, um cálculo O(n) que virou O(n²).
+
+O resultado é emitido em JSON e comparado com a baseline versionada em
+`benchmark_baseline.json` (ou outra indicada em --baseline), com limites
+configuráveis de regressão. Como a velocidade da máquina varia entre
+execuções, a comparação de tempo usa o tempo relativo: a mediana, entre as
+repetições, da razão entre o tempo do caso e o de uma carga de referência
+fixa medida logo antes. Ao trocar de máquina, gere uma nova baseline com
+--salvar-baseline benchmark_baseline.json.
+
+Uso:
+    python benchmark.py --saida resultado.json
+    python benchmark.py --salvar-baseline benchmark_baseline.json
+    python benchmark.py --baseline outra.json --limite-tempo 1.5 --limite-expoente 0.3
+    python benchmark.py --sem-baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+# Cada caso: nome -> (tamanhos, preparar(n) -> função sem argumentos)
+Caso = Tuple[List[int], Callable[[int], Callable[[], object]]]
+
+# Baseline versionada junto com o código
+BASELINE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'benchmark_baseline.json')
+
+# Funções O(1) são medidas em blocos de chamadas para ficar acima do ruído
+CHAMADAS_POR_MEDICAO = 10_000
+
+# Cada repetição executa o caso várias vezes, até somar pelo menos este tempo
+TEMPO_MINIMO_REPETICAO = 0.1
+
+
+def _carga_referencia() -> None:
+    """Carga fixa (dicionário e aritmética) usada para normalizar os tempos"""
+    contagens = {}
+    for i in range(20_000):
+        contagens[i % 1000] = contagens.get(i % 1000, 0) + i * 2.5
+
+
+def _caso_verifica_string(n: int) -> Callable[[], object]:
+    from pergunta_1 import verifica_string
+    texto = 'B' + 'x' * max(0, n - 2) + 'A'
+    
+    def executar():
+        for _ in range(CHAMADAS_POR_MEDICAO):
+            verifica_string(texto)
+    return executar
+
+
+def _caso_print_valor(n: int) -> Callable[[], object]:
+    from pergunta_2 import print_valor
+    
+    def executar():
+        for _ in range(CHAMADAS_POR_MEDICAO):
+            print_valor(n)
+    return executar
+
+
+def _caso_gerar_sequencia(n: int) -> Callable[[], object]:
+    from pergunta_2 import gerar_sequencia
+    return lambda: gerar_sequencia(n)
+
+
+def _caso_analisa_tabuleiro(n: int) -> Callable[[], object]:
+    from pergunta_3 import analisa_tabuleiro, contar_caminhos_otimos
+    
+    def executar():
+        # Sem o cache de execuções anteriores, para medir o custo real
+        contar_caminhos_otimos.cache_clear()
+        return analisa_tabuleiro(n)
+    return executar
+
+
+def _caso_calcular_beneficios(n: int) -> Callable[[], object]:
+    from gerador_funcionarios import gerar_funcionarios
+    from pergunta_4 import cache_periodos, calcular_beneficios
+    registros = list(gerar_funcionarios(n, semente=n))
+    
+    def executar():
+        cache_periodos.limpar()
+        for registro in registros:
+            calcular_beneficios(*registro)
+    return executar
+
+
+def _caso_calcular_beneficios_lote(n: int) -> Callable[[], object]:
+    from gerador_funcionarios import gerar_funcionarios
+    from pergunta_4 import cache_periodos, calcular_beneficios_lote
+    registros = list(gerar_funcionarios(n, semente=n))
+    
+    def executar():
+        cache_periodos.limpar()
+        for _ in calcular_beneficios_lote(registros):
+            pass
+    return executar
+
+
+CASOS: Dict[str, Caso] = {
+    'verifica_string': ([10, 1_000, 100_000, 10_000_000], _caso_verifica_string),
+    'print_valor': ([10, 10**6, 10**12, 10**18], _caso_print_valor),
+    'gerar_sequencia': ([1_000, 10_000, 100_000], _caso_gerar_sequencia),
+    # contar_caminhos_otimos é recursivo (profundidade ~ n/3): limitado pelo limite de recursão
+    'analisa_tabuleiro': ([50, 100, 200, 400, 800], _caso_analisa_tabuleiro),
+    'calcular_beneficios': ([1_000, 10_000, 100_000], _caso_calcular_beneficios),
+    'calcular_beneficios_lote': ([1_000, 10_000, 100_000], _caso_calcular_beneficios_lote),
+}
+
+
+def medir_caso(
+    preparar: Callable[[int], Callable[[], object]],
+    tamanho: int,
+    repeticoes: int = 7
+) -> Dict[str, float]:
+    """
+    Mede tempo e pico de memória de um caso em um tamanho de entrada.
+    
+    Execuções curtas são repetidas dentro de cada repetição até somar
+    `TEMPO_MINIMO_REPETICAO` segundos. Antes de cada repetição é medida a
+    carga de referência, e o tempo relativo é a mediana das razões.
+    
+    Args:
+        preparar (Callable): Recebe o tamanho e retorna a função a medir
+        tamanho (int): Tamanho da entrada
+        repeticoes (int): Repetições de tempo (vale a menor)
+    
+    Returns:
+        Dict[str, float]: tamanho, tempo_s (por execução), tempo_relativo,
+            execucoes (por repetição) e memoria_pico_bytes
+    """
+    executar = preparar(tamanho)
+    
+    # A primeira execução também aquece caches de import e de alocação
+    inicio = time.perf_counter()
+    executar()
+    primeira = time.perf_counter() - inicio
+    execucoes = max(1, math.ceil(TEMPO_MINIMO_REPETICAO / max(primeira, 1e-9)))
+    
+    tempos = []
+    razoes = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        _carga_referencia()
+        referencia = time.perf_counter() - inicio
+        
+        inicio = time.perf_counter()
+        for _ in range(execucoes):
+            executar()
+        tempo = (time.perf_counter() - inicio) / execucoes
+        tempos.append(tempo)
+        razoes.append(tempo / referencia)
+    
+    tracemalloc.start()
+    executar()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    return {
+        'tamanho': tamanho,
+        'tempo_s': min(tempos),
+        'tempo_relativo': round(statistics.median(razoes), 4),
+        'execucoes': execucoes,
+        'memoria_pico_bytes': pico
+    }
+
+
+def estimar_expoente(pontos: List[Dict[str, float]]) -> float:
+    """
+    Estima o maior expoente k de t ~ n^k entre tamanhos consecutivos.
+    
+    Usa o tempo relativo (veja `medir_caso`), menos sensível a variações
+    de velocidade da máquina durante a execução. Tempos muito pequenos
+    (abaixo de 50 µs) são ignorados por serem dominados por ruído.
+    
+    Args:
+        pontos (List[Dict[str, float]]): Medições ordenadas por tamanho
+    
+    Returns:
+        float: Maior expoente observado (0.0 se não houver pontos suficientes)
+    """
+    expoentes = []
+    for anterior, atual in zip(pontos, pontos[1:]):
+        if anterior['tempo_s'] < 5e-5 or atual['tempo_s'] < 5e-5:
+            continue
+        chave = 'tempo_relativo' if 'tempo_relativo' in anterior else 'tempo_s'
+        expoentes.append(
+            math.log(atual[chave] / anterior[chave])
+            / math.log(atual['tamanho'] / anterior['tamanho'])
+        )
+    return round(max(expoentes), 3) if expoentes else 0.0
+
+
+def executar_benchmarks(nomes: List[str], repeticoes: int = 7) -> dict:
+    """
+    Executa os casos selecionados em todos os seus tamanhos.
+    
+    Args:
+        nomes (List[str]): Nomes dos casos em CASOS
+        repeticoes (int): Repetições de tempo por tamanho
+    
+    Returns:
+        dict: Resultado no formato JSON da suíte
+    """
+    resultado = {'python': sys.version.split()[0], 'casos': {}}
+    for nome in nomes:
+        tamanhos, preparar = CASOS[nome]
+        pontos = []
+        for tamanho in tamanhos:
+            ponto = medir_caso(preparar, tamanho, repeticoes)
+            pontos.append(ponto)
+            print(
+                f"  {nome:<26} n={tamanho:<28,} {ponto['tempo_s'] * 1000:>12.3f} ms "
+                f"{ponto['memoria_pico_bytes'] / 1024:>12.1f} KiB",
+                file=sys.stderr
+            )
+        resultado['casos'][nome] = {'pontos': pontos, 'expoente': estimar_expoente(pontos)}
+    return resultado
+
+
+def comparar_com_baseline(
+    resultado: dict,
+    baseline: dict,
+    limite_tempo: float,
+    limite_memoria: float,
+    limite_expoente: float
+) -> List[str]:
+    """
+    Compara um resultado com a baseline e lista as regressões.
+    
+    Args:
+        resultado (dict): Resultado atual
+        baseline (dict): Resultado de referência
+        limite_tempo (float): Razão máxima tempo relativo atual / baseline
+        limite_memoria (float): Razão máxima memória atual / baseline
+        limite_expoente (float): Aumento máximo do expoente de escala
+    
+    Returns:
+        List[str]: Descrição de cada regressão encontrada (vazia se nenhuma)
+    """
+    regressoes = []
+    for nome, caso in resultado['casos'].items():
+        caso_base = baseline.get('casos', {}).get(nome)
+        if caso_base is None:
+            continue
+        
+        pontos_base = {p['tamanho']: p for p in caso_base['pontos']}
+        for ponto in caso['pontos']:
+            base = pontos_base.get(ponto['tamanho'])
+            if base is None:
+                continue
+            if 'tempo_relativo' in base:
+                if ponto['tempo_relativo'] > base['tempo_relativo'] * limite_tempo:
+                    regressoes.append(
+                        f"{nome} n={ponto['tamanho']}: tempo relativo {ponto['tempo_relativo']} "
+                        f"> {limite_tempo}x baseline ({base['tempo_relativo']})"
+                    )
+            elif base['tempo_s'] >= 5e-5 and ponto['tempo_s'] > base['tempo_s'] * limite_tempo:
+                regressoes.append(
+                    f"{nome} n={ponto['tamanho']}: tempo {ponto['tempo_s']:.6f}s "
+                    f"> {limite_tempo}x baseline ({base['tempo_s']:.6f}s)"
+                )
+            if ponto['memoria_pico_bytes'] > max(base['memoria_pico_bytes'], 1024) * limite_memoria:
+                regressoes.append(
+                    f"{nome} n={ponto['tamanho']}: memória {ponto['memoria_pico_bytes']} B "
+                    f"> {limite_memoria}x baseline ({base['memoria_pico_bytes']} B)"
+                )
+        
+        if caso['expoente'] > caso_base['expoente'] + limite_expoente:
+            regressoes.append(
+                f"{nome}: expoente de escala {caso['expoente']} "
+                f"> baseline {caso_base['expoente']} + {limite_expoente}"
+            )
+    return regressoes
+
+
+def main() -> None:
+    """Interface de linha de comando da suíte"""
+    parser = argparse.ArgumentParser(description="Benchmarks com curvas de escala das 4 perguntas")
+    parser.add_argument('casos', nargs='*', help=f"Casos a executar (padrão: todos): {', '.join(CASOS)}")
+    parser.add_argument('--repeticoes', type=int, default=7)
+    parser.add_argument('--saida', help="Arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument('--salvar-baseline', help="Salva o resultado como baseline neste arquivo")
+    parser.add_argument(
+        '--baseline', default=BASELINE_PADRAO,
+        help="Baseline para comparação (padrão: benchmark_baseline.json)"
+    )
+    parser.add_argument('--sem-baseline', action='store_true', help="Não compara com baseline")
+    parser.add_argument('--limite-tempo', type=float, default=1.5)
+    parser.add_argument('--limite-memoria', type=float, default=1.5)
+    parser.add_argument('--limite-expoente', type=float, default=0.3)
+    args = parser.parse_args()
+    
+    desconhecidos = [nome for nome in args.casos if nome not in CASOS]
+    if desconhecidos:
+        parser.error(f"casos desconhecidos: {', '.join(desconhecidos)}")
+    
+    print("=== Benchmarks ===", file=sys.stderr)
+    resultado = executar_benchmarks(args.casos or list(CASOS), args.repeticoes)
+    
+    texto = json.dumps(resultado, indent=2)
+    if args.saida:
+        with open(args.saida, 'w') as arquivo:
+            arquivo.write(texto)
+    else:
+        print(texto)
+    
+    if args.salvar_baseline:
+        with open(args.salvar_baseline, 'w') as arquivo:
+            arquivo.write(texto)
+    
+    if not args.sem_baseline:
+        with open(args.baseline) as arquivo:
+            baseline = json.load(arquivo)
+        regressoes = comparar_com_baseline(
+            resultado, baseline, args.limite_tempo, args.limite_memoria, args.limite_expoente
+        )
+        if regressoes:
+            print("\n❌ Regressões encontradas:", file=sys.stderr)
+            for regressao in regressoes:
+                print(f"  • {regressao}", file=sys.stderr)
+            sys.exit(1)
+        print("\n✅ Nenhuma regressão em relação à baseline", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de memória dos resultados da Pergunta 4
+
+Compara a memória ocupada por N resultados guardados como a tupla
+(férias, décimo, detalhes) de `calcular_beneficios` e como
+`ResultadoBeneficios` de `calcular_beneficios_resultado`.
+
+Uso:
+    python benchmark_memoria.py [quantidade]
+"""
+
+import sys
+import time
+import tracemalloc
+from datetime import date, timedelta
+from typing import Callable, List, Tuple
+
+from pergunta_4 import calcular_beneficios, calcular_beneficios_resultado
+
+
+def gerar_entradas(quantidade: int) -> List[Tuple[float, date, date]]:
+    """
+    Gera entradas determinísticas variadas para o benchmark.
+    
+    Args:
+        quantidade (int): Número de entradas
+    
+    Returns:
+        List[Tuple[float, date, date]]: Tuplas (salário, admissão, demissão)
+    """
+    inicio = date(2015, 1, 1)
+    return [
+        (
+            1500.0 + (i % 97) * 100,
+            inicio + timedelta(days=i % 2000),
+            inicio + timedelta(days=i % 2000 + 30 + i % 1500)
+        )
+        for i in range(quantidade)
+    ]
+
+
+def medir(funcao: Callable, entradas: List[Tuple[float, date, date]]) -> Tuple[float, int]:
+    """
+    Mede tempo e memória retida pelos resultados de uma função.
+    
+    Args:
+        funcao (Callable): Função de cálculo a medir
+        entradas (List[Tuple[float, date, date]]): Entradas do cálculo
+    
+    Returns:
+        Tuple[float, int]: Tempo em segundos e bytes retidos pelos resultados
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultados = [funcao(*entrada) for entrada in entradas]
+    duracao = time.perf_counter() - inicio
+    memoria, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultados
+    return duracao, memoria
+
+
+def main(quantidade: int = 1_000_000) -> None:
+    """Executa o benchmark e imprime a comparação"""
+    entradas = gerar_entradas(quantidade)
+    
+    print(f"=== Benchmark de memória: {quantidade:,} resultados ===\n")
+    print(f"{'Formato':<25} {'Tempo (s)':<12} {'Memória (MB)':<14} {'Bytes/resultado':<15}")
+    print("-" * 70)
+    
+    for nome, funcao in [
+        ("tupla + detalhes", calcular_beneficios),
+        ("ResultadoBeneficios", calcular_beneficios_resultado),
+    ]:
+        duracao, memoria = medir(funcao, entradas)
+        print(
+            f"{nome:<25} {duracao:<12.2f} {memoria / 2**20:<14.1f} "
+            f"{memoria / quantidade:<15.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
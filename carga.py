@@ -0,0 +1,152 @@
+"""
+Gerador de carga para o servidor HTTP local (servidor.py)
+
+Abre conexões keep-alive concorrentes, distribui as requisições entre elas
+e reporta latência (p50, p90, p99, máxima) e vazão.
+
+Uso:
+    python carga.py --url "http://127.0.0.1:8080/tabuleiro?n_casas=500" --requisicoes 2000 --conexoes 50
+    python carga.py --url "http://127.0.0.1:8080/tabuleiro?n_casas=300" --url "http://127.0.0.1:8080/saude"
+"""
+
+import argparse
+import asyncio
+import time
+from itertools import cycle
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+
+def percentil(valores_ordenados: List[float], p: float) -> float:
+    """
+    Percentil pelo método do posto mais próximo.
+    
+    Args:
+        valores_ordenados (List[float]): Valores em ordem crescente
+        p (float): Percentil entre 0 e 100
+    
+    Returns:
+        float: Valor do percentil (0.0 se a lista estiver vazia)
+    """
+    if not valores_ordenados:
+        return 0.0
+    indice = max(0, min(len(valores_ordenados) - 1, round(p / 100 * len(valores_ordenados)) - 1))
+    return valores_ordenados[indice]
+
+
+async def _cliente(
+    host: str,
+    porta: int,
+    alvos,
+    restantes: List[int],
+    latencias: List[float],
+    status: Dict[int, int]
+) -> None:
+    """Uma conexão keep-alive que envia requisições até acabar a cota"""
+    reader, writer = await asyncio.open_connection(host, porta)
+    try:
+        while restantes[0] > 0:
+            restantes[0] -= 1
+            alvo = next(alvos)
+            inicio = time.perf_counter()
+            writer.write(f"GET {alvo} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+            await writer.drain()
+            
+            codigo, tamanho_corpo, fechar = await _ler_cabecalho(reader)
+            await reader.readexactly(tamanho_corpo)
+            latencias.append(time.perf_counter() - inicio)
+            status[codigo] = status.get(codigo, 0) + 1
+            
+            if fechar:
+                writer.close()
+                reader, writer = await asyncio.open_connection(host, porta)
+    finally:
+        writer.close()
+
+
+async def _ler_cabecalho(reader: asyncio.StreamReader) -> Tuple[int, int, bool]:
+    """Lê status, Content-Length e se o servidor vai fechar a conexão"""
+    linha_status = await reader.readline()
+    if not linha_status:
+        raise ConnectionError("Conexão fechada pelo servidor")
+    codigo = int(linha_status.split()[1])
+    tamanho_corpo = 0
+    fechar = False
+    while True:
+        linha = await reader.readline()
+        if linha in (b'\r\n', b'\n', b''):
+            break
+        nome, _, valor = linha.decode('latin-1').partition(':')
+        nome = nome.strip().lower()
+        if nome == 'content-length':
+            tamanho_corpo = int(valor)
+        elif nome == 'connection':
+            fechar = valor.strip().lower() == 'close'
+    return codigo, tamanho_corpo, fechar
+
+
+async def executar_carga(urls: List[str], requisicoes: int, conexoes: int) -> dict:
+    """
+    Executa a carga e retorna as estatísticas.
+    
+    Args:
+        urls (List[str]): URLs alternadas entre as requisições (mesmo host)
+        requisicoes (int): Total de requisições
+        conexoes (int): Conexões simultâneas
+    
+    Returns:
+        dict: Requisições, duração, vazão, percentis de latência e status
+    """
+    partes = urlsplit(urls[0])
+    host, porta = partes.hostname, partes.port or 80
+    alvos = cycle([
+        urlsplit(url).path + (f"?{urlsplit(url).query}" if urlsplit(url).query else '')
+        for url in urls
+    ])
+    
+    restantes = [requisicoes]
+    latencias: List[float] = []
+    status: Dict[int, int] = {}
+    
+    inicio = time.perf_counter()
+    await asyncio.gather(*[
+        _cliente(host, porta, alvos, restantes, latencias, status)
+        for _ in range(min(conexoes, requisicoes))
+    ])
+    duracao = time.perf_counter() - inicio
+    
+    latencias.sort()
+    return {
+        'requisicoes': len(latencias),
+        'duracao_s': duracao,
+        'vazao_rps': len(latencias) / duracao if duracao else 0.0,
+        'p50_ms': percentil(latencias, 50) * 1000,
+        'p90_ms': percentil(latencias, 90) * 1000,
+        'p99_ms': percentil(latencias, 99) * 1000,
+        'max_ms': (latencias[-1] if latencias else 0.0) * 1000,
+        'status': status
+    }
+
+
+def main() -> None:
+    """Interface de linha de comando do gerador de carga"""
+    parser = argparse.ArgumentParser(description="Gerador de carga para servidor.py")
+    parser.add_argument('--url', action='append', required=True, help="URL alvo (pode repetir)")
+    parser.add_argument('--requisicoes', type=int, default=1000)
+    parser.add_argument('--conexoes', type=int, default=20)
+    args = parser.parse_args()
+    
+    resultado = asyncio.run(executar_carga(args.url, args.requisicoes, args.conexoes))
+    
+    print(f"=== Carga: {resultado['requisicoes']:,} requisições em {args.conexoes} conexões ===\n")
+    print(f"  Duração: {resultado['duracao_s']:.2f} s")
+    print(f"  Vazão: {resultado['vazao_rps']:,.1f} req/s")
+    print(f"  Latência p50: {resultado['p50_ms']:.2f} ms")
+    print(f"  Latência p90: {resultado['p90_ms']:.2f} ms")
+    print(f"  Latência p99: {resultado['p99_ms']:.2f} ms")
+    print(f"  Latência máxima: {resultado['max_ms']:.2f} ms")
+    print(f"  Status: {resultado['status']}")
+
+
+if __name__ == "__main__":
+    main()
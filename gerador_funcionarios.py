@@ -0,0 +1,272 @@
+"""
+Gerador determinístico de funcionários sintéticos para testes de carga da Pergunta 4
+
+Gera linhas (salário, data de admissão, data de demissão) com distribuições
+realistas e uma fração de casos especiais tratados pelo cálculo:
+- Admissões em 29 de fevereiro
+- Admissão e demissão no mesmo ano
+- Demissões nas fronteiras de 15 dias (14, 15 e 16 dias trabalhados no mês)
+- Ondas de contratação e demissão (muitos funcionários com o mesmo par de datas)
+
+A geração é em fluxo: memória constante, independente da quantidade de linhas.
+A mesma semente sempre produz as mesmas linhas.
+
+Uso:
+    python gerador_funcionarios.py --quantidade 1000000 --formato csv --saida funcionarios.csv
+    python gerador_funcionarios.py --quantidade 1000000 --formato binario --saida funcionarios/
+"""
+
+import argparse
+import csv
+import math
+import os
+import random
+import sys
+from array import array
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import Iterator, Tuple
+
+DATA_MINIMA = date(2000, 1, 1)
+DATA_MAXIMA = date(2025, 12, 31)
+SALARIO_MINIMO = 1412.0
+
+# Colunas do formato binário: nome do arquivo e typecode do array
+COLUNAS_BINARIAS = (
+    ('salario.f64', 'd'),
+    ('admissao.i32', 'i'),
+    ('demissao.i32', 'i'),
+)
+TAMANHO_BLOCO = 65536
+
+
+def gerar_funcionarios(
+    quantidade: int,
+    semente: int = 42,
+    proporcao_especiais: float = 0.2,
+    ondas: int = 50
+) -> Iterator[Tuple[float, date, date]]:
+    """
+    Gera funcionários sintéticos em fluxo.
+    
+    Args:
+        quantidade (int): Número de linhas a gerar
+        semente (int): Semente do gerador pseudoaleatório
+        proporcao_especiais (float): Fração de linhas com casos especiais
+        ondas (int): Número de ondas de contratação/demissão compartilhadas
+    
+    Yields:
+        Tuple[float, date, date]: (salário, data de admissão, data de demissão)
+    
+    Raises:
+        ValueError: Se quantidade for negativa ou proporcao_especiais fora de [0, 1]
+    
+    Examples:
+        >>> linhas = list(gerar_funcionarios(3, semente=1))
+        >>> linhas == list(gerar_funcionarios(3, semente=1))
+        True
+    """
+    if quantidade < 0:
+        raise ValueError("A quantidade deve ser maior ou igual a 0")
+    
+    if not 0 <= proporcao_especiais <= 1:
+        raise ValueError("A proporção de casos especiais deve estar entre 0 e 1")
+    
+    rng = random.Random(semente)
+    intervalo = (DATA_MAXIMA - DATA_MINIMA).days
+    
+    # Pares de datas compartilhados pelas ondas de contratação/demissão
+    pares_ondas = [_gerar_par_comum(rng, intervalo) for _ in range(ondas)]
+    
+    for _ in range(quantidade):
+        salario = _gerar_salario(rng)
+        sorteio = rng.random()
+        
+        if sorteio < proporcao_especiais:
+            data_admissao, data_demissao = _gerar_par_especial(rng, intervalo)
+        elif pares_ondas and sorteio < proporcao_especiais + (1 - proporcao_especiais) / 2:
+            data_admissao, data_demissao = pares_ondas[rng.randrange(len(pares_ondas))]
+        else:
+            data_admissao, data_demissao = _gerar_par_comum(rng, intervalo)
+        
+        yield salario, data_admissao, data_demissao
+
+
+def _gerar_salario(rng: random.Random) -> float:
+    """Salário log-normal (mediana ~R$ 3.500), nunca abaixo do mínimo"""
+    return round(max(SALARIO_MINIMO, rng.lognormvariate(math.log(3500), 0.6)), 2)
+
+
+def _gerar_par_comum(rng: random.Random, intervalo: int) -> Tuple[date, date]:
+    """Admissão uniforme no intervalo e tempo de casa com cauda longa"""
+    data_admissao = DATA_MINIMA + timedelta(days=rng.randrange(intervalo))
+    dias_restantes = (DATA_MAXIMA - data_admissao).days
+    tempo_casa = min(int(rng.expovariate(1 / 900)), dias_restantes)
+    return data_admissao, data_admissao + timedelta(days=tempo_casa)
+
+
+def _gerar_par_especial(rng: random.Random, intervalo: int) -> Tuple[date, date]:
+    """Sorteia um dos casos especiais do cálculo"""
+    caso = rng.randrange(3)
+    
+    if caso == 0:
+        # Admissão em 29 de fevereiro (aniversários caem em anos não bissextos)
+        ano = rng.choice([a for a in range(DATA_MINIMA.year, DATA_MAXIMA.year) if a % 4 == 0])
+        data_admissao = date(ano, 2, 29)
+        dias_restantes = (DATA_MAXIMA - data_admissao).days
+        return data_admissao, data_admissao + timedelta(days=rng.randrange(dias_restantes))
+    
+    if caso == 1:
+        # Admissão e demissão no mesmo ano
+        data_admissao = DATA_MINIMA + timedelta(days=rng.randrange(intervalo))
+        fim_ano = date(data_admissao.year, 12, 31)
+        dias = rng.randrange((fim_ano - data_admissao).days + 1)
+        return data_admissao, data_admissao + timedelta(days=dias)
+    
+    # Fronteira de 15 dias: 14, 15 ou 16 dias trabalhados no mês da demissão,
+    # contados a partir do dia da admissão (férias) e do dia 1 (décimo terceiro)
+    data_admissao, data_demissao = _gerar_par_comum(rng, intervalo)
+    if (data_demissao.year, data_demissao.month) == (data_admissao.year, data_admissao.month):
+        data_demissao = _somar_um_mes(data_demissao)
+    dias = rng.choice([14, 15, 16])
+    base = data_admissao.day if rng.random() < 0.5 else 1
+    ultimo_dia = monthrange(data_demissao.year, data_demissao.month)[1]
+    dia = base + dias - 1 if base + dias - 1 <= ultimo_dia else dias
+    return data_admissao, data_demissao.replace(day=dia)
+
+
+def _somar_um_mes(data: date) -> date:
+    """Primeiro dia do mês seguinte"""
+    if data.month == 12:
+        return date(data.year + 1, 1, 1)
+    return date(data.year, data.month + 1, 1)
+
+
+def escrever_csv(linhas: Iterator[Tuple[float, date, date]], destino) -> int:
+    """
+    Escreve as linhas em CSV (salario, data_admissao, data_demissao em ISO 8601).
+    
+    Args:
+        linhas (Iterator[Tuple[float, date, date]]): Linhas a escrever
+        destino: Arquivo de texto aberto para escrita
+    
+    Returns:
+        int: Número de linhas escritas
+    """
+    escritor = csv.writer(destino)
+    escritor.writerow(['salario', 'data_admissao', 'data_demissao'])
+    total = 0
+    for salario, data_admissao, data_demissao in linhas:
+        escritor.writerow([salario, data_admissao.isoformat(), data_demissao.isoformat()])
+        total += 1
+    return total
+
+
+def ler_csv(origem) -> Iterator[Tuple[float, date, date]]:
+    """
+    Lê em fluxo as linhas escritas por `escrever_csv`.
+    
+    Args:
+        origem: Arquivo de texto aberto para leitura
+    
+    Yields:
+        Tuple[float, date, date]: (salário, data de admissão, data de demissão)
+    """
+    leitor = csv.reader(origem)
+    next(leitor, None)
+    for salario, data_admissao, data_demissao in leitor:
+        yield float(salario), date.fromisoformat(data_admissao), date.fromisoformat(data_demissao)
+
+
+def escrever_colunas(linhas: Iterator[Tuple[float, date, date]], diretorio: str) -> int:
+    """
+    Escreve as linhas em arquivos binários colunares.
+    
+    Cada coluna vai para um arquivo próprio (salários em float64, datas como
+    ordinais int32), gravado em blocos de tamanho fixo.
+    
+    Args:
+        linhas (Iterator[Tuple[float, date, date]]): Linhas a escrever
+        diretorio (str): Diretório de saída (criado se não existir)
+    
+    Returns:
+        int: Número de linhas escritas
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    arquivos = [open(os.path.join(diretorio, nome), 'wb') for nome, _ in COLUNAS_BINARIAS]
+    blocos = [array(typecode) for _, typecode in COLUNAS_BINARIAS]
+    salarios, admissoes, demissoes = blocos
+    total = 0
+    try:
+        for salario, data_admissao, data_demissao in linhas:
+            salarios.append(salario)
+            admissoes.append(data_admissao.toordinal())
+            demissoes.append(data_demissao.toordinal())
+            total += 1
+            if len(salarios) == TAMANHO_BLOCO:
+                for bloco, arquivo in zip(blocos, arquivos):
+                    bloco.tofile(arquivo)
+                    del bloco[:]
+        for bloco, arquivo in zip(blocos, arquivos):
+            bloco.tofile(arquivo)
+    finally:
+        for arquivo in arquivos:
+            arquivo.close()
+    return total
+
+
+def ler_colunas(diretorio: str) -> Iterator[Tuple[float, date, date]]:
+    """
+    Lê em fluxo, bloco a bloco, as colunas escritas por `escrever_colunas`.
+    
+    Args:
+        diretorio (str): Diretório com os arquivos de colunas
+    
+    Yields:
+        Tuple[float, date, date]: (salário, data de admissão, data de demissão)
+    """
+    arquivos = [open(os.path.join(diretorio, nome), 'rb') for nome, _ in COLUNAS_BINARIAS]
+    try:
+        while True:
+            blocos = []
+            for (_, typecode), arquivo in zip(COLUNAS_BINARIAS, arquivos):
+                bloco = array(typecode)
+                dados = arquivo.read(TAMANHO_BLOCO * bloco.itemsize)
+                bloco.frombytes(dados)
+                blocos.append(bloco)
+            if not blocos[0]:
+                return
+            for salario, admissao, demissao in zip(*blocos):
+                yield salario, date.fromordinal(admissao), date.fromordinal(demissao)
+    finally:
+        for arquivo in arquivos:
+            arquivo.close()
+
+
+def main() -> None:
+    """Interface de linha de comando do gerador"""
+    parser = argparse.ArgumentParser(description="Gera funcionários sintéticos para a Pergunta 4")
+    parser.add_argument('--quantidade', type=int, default=1_000_000)
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--proporcao-especiais', type=float, default=0.2)
+    parser.add_argument('--formato', choices=['csv', 'binario'], default='csv')
+    parser.add_argument('--saida', default='-', help="Arquivo CSV, diretório binário ou '-' para stdout")
+    args = parser.parse_args()
+    
+    linhas = gerar_funcionarios(args.quantidade, args.semente, args.proporcao_especiais)
+    
+    if args.formato == 'binario':
+        if args.saida == '-':
+            parser.error("o formato binário exige um diretório em --saida")
+        total = escrever_colunas(linhas, args.saida)
+    elif args.saida == '-':
+        total = escrever_csv(linhas, sys.stdout)
+    else:
+        with open(args.saida, 'w', newline='') as destino:
+            total = escrever_csv(linhas, destino)
+    
+    print(f"{total:,} funcionários gerados", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
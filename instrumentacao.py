@@ -0,0 +1,309 @@
+"""
+Instrumentação opcional dos cálculos das 4 perguntas
+
+Coleta, quando ativada:
+- Contagem de chamadas e histograma de latência por função
+- Tamanho das tabelas de programação dinâmica da Pergunta 3
+- Taxa de acerto dos caches (lru_cache de `contar_caminhos_otimos`,
+  cache de períodos da Pergunta 4)
+
+Desativada (padrão), cada função instrumentada custa apenas a verificação
+de `metricas.ativo` antes de chamar a função original. A função envolvida
+é o próprio atributo do módulo, então imports feitos antes de `ativar()`
+também são medidos e a função continua podendo ser enviada a um pool de
+processos (pickle por módulo e nome). As métricas são por processo: o que
+roda em um processo do pool não é contado no processo principal.
+
+As métricas podem ser exportadas no formato texto do Prometheus ou em JSON.
+Não é seguro ativar a coleta com várias threads chamando os cálculos.
+
+Uso:
+    import instrumentacao
+    instrumentacao.ativar()
+    ...
+    print(instrumentacao.exportar_prometheus())
+"""
+
+import json
+import time
+from bisect import bisect_left
+from functools import wraps
+from typing import Callable, Dict, List
+
+# Limites superiores (em segundos) dos buckets do histograma de latência
+BUCKETS_LATENCIA = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+
+
+class _Metricas:
+    """Estado global da instrumentação"""
+    
+    __slots__ = ('ativo', 'chamadas', 'latencias', 'tabelas', 'caches')
+    
+    def __init__(self) -> None:
+        self.ativo = False
+        # funcao -> total de chamadas
+        self.chamadas: Dict[str, int] = {}
+        # funcao -> [contagem por bucket (+Inf no fim), soma em segundos]
+        self.latencias: Dict[str, list] = {}
+        # funcao -> [quantidade de tabelas, soma de células, maior tabela]
+        self.tabelas: Dict[str, List[int]] = {}
+        # cache -> função que retorna {'hits', 'misses', 'tamanho'}
+        self.caches: Dict[str, Callable[[], dict]] = {}
+
+
+metricas = _Metricas()
+
+
+def ativar() -> None:
+    """Ativa a coleta de métricas."""
+    metricas.ativo = True
+
+
+def desativar() -> None:
+    """Desativa a coleta de métricas (os valores coletados são mantidos)."""
+    metricas.ativo = False
+
+
+def zerar() -> None:
+    """Descarta as métricas coletadas (os caches registrados são mantidos)."""
+    metricas.chamadas.clear()
+    metricas.latencias.clear()
+    metricas.tabelas.clear()
+
+
+def instrumentar(funcao: Callable) -> Callable:
+    """
+    Decorador que conta chamadas e mede a latência de uma função.
+    
+    Args:
+        funcao (Callable): Função a instrumentar
+    
+    Returns:
+        Callable: Função envolvida, com mesmo nome e docstring
+    """
+    nome = funcao.__name__
+    
+    @wraps(funcao)
+    def envolvida(*args, **kwargs):
+        if not metricas.ativo:
+            return funcao(*args, **kwargs)
+        
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            _registrar_latencia(nome, time.perf_counter() - inicio)
+    
+    return envolvida
+
+
+def _registrar_latencia(nome: str, duracao: float) -> None:
+    metricas.chamadas[nome] = metricas.chamadas.get(nome, 0) + 1
+    latencia = metricas.latencias.get(nome)
+    if latencia is None:
+        latencia = metricas.latencias[nome] = [[0] * (len(BUCKETS_LATENCIA) + 1), 0.0]
+    latencia[0][bisect_left(BUCKETS_LATENCIA, duracao)] += 1
+    latencia[1] += duracao
+
+
+def registrar_tabela(nome: str, celulas: int) -> None:
+    """
+    Registra o tamanho de uma tabela de programação dinâmica.
+    
+    Deve ser chamada apenas com `metricas.ativo` verdadeiro.
+    
+    Args:
+        nome (str): Função que montou a tabela
+        celulas (int): Número de células da tabela
+    """
+    tabela = metricas.tabelas.get(nome)
+    if tabela is None:
+        metricas.tabelas[nome] = [1, celulas, celulas]
+        return
+    tabela[0] += 1
+    tabela[1] += celulas
+    tabela[2] = max(tabela[2], celulas)
+
+
+def registrar_cache(nome: str, estatisticas: Callable[[], dict]) -> None:
+    """
+    Registra um cache para exportar sua taxa de acerto.
+    
+    Args:
+        nome (str): Nome do cache
+        estatisticas (Callable[[], dict]): Retorna 'hits', 'misses' e 'tamanho'
+    """
+    metricas.caches[nome] = estatisticas
+
+
+def registrar_lru_cache(nome: str, funcao: Callable) -> None:
+    """
+    Registra uma função decorada com `functools.lru_cache`.
+    
+    Args:
+        nome (str): Nome do cache
+        funcao (Callable): Função com `cache_info()`
+    """
+    def estatisticas() -> dict:
+        info = funcao.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'tamanho': info.currsize}
+    
+    registrar_cache(nome, estatisticas)
+
+
+def coletar() -> dict:
+    """
+    Retorna um retrato das métricas coletadas.
+    
+    Returns:
+        dict: Funções (chamadas, latência), tabelas de DP e caches
+    """
+    funcoes = {}
+    for nome, (contagens, soma) in metricas.latencias.items():
+        funcoes[nome] = {
+            'chamadas': metricas.chamadas[nome],
+            'latencia_soma_s': soma,
+            'latencia_buckets': {
+                **{str(limite): contagem for limite, contagem in zip(BUCKETS_LATENCIA, contagens)},
+                '+Inf': contagens[-1]
+            }
+        }
+    
+    tabelas = {
+        nome: {'quantidade': quantidade, 'celulas_soma': soma, 'celulas_max': maximo}
+        for nome, (quantidade, soma, maximo) in metricas.tabelas.items()
+    }
+    
+    caches = {}
+    for nome, estatisticas in metricas.caches.items():
+        dados = estatisticas()
+        consultas = dados['hits'] + dados['misses']
+        caches[nome] = {
+            'hits': dados['hits'],
+            'misses': dados['misses'],
+            'tamanho': dados['tamanho'],
+            'taxa_acerto': dados['hits'] / consultas if consultas else 0.0
+        }
+    
+    return {'ativo': metricas.ativo, 'funcoes': funcoes, 'tabelas_dp': tabelas, 'caches': caches}
+
+
+def exportar_json() -> str:
+    """
+    Exporta as métricas em JSON.
+    
+    Returns:
+        str: Documento JSON com o retrato de `coletar()`
+    """
+    return json.dumps(coletar(), indent=2)
+
+
+def exportar_prometheus() -> str:
+    """
+    Exporta as métricas no formato texto do Prometheus.
+    
+    Returns:
+        str: Métricas no formato de exposição do Prometheus
+    """
+    dados = coletar()
+    linhas = [
+        '# HELP desafio_chamadas_total Chamadas por função.',
+        '# TYPE desafio_chamadas_total counter',
+    ]
+    for nome, funcao in dados['funcoes'].items():
+        linhas.append(f'desafio_chamadas_total{{funcao="{nome}"}} {funcao["chamadas"]}')
+    
+    linhas += [
+        '# HELP desafio_latencia_segundos Latência por função.',
+        '# TYPE desafio_latencia_segundos histogram',
+    ]
+    for nome, (contagens, soma) in metricas.latencias.items():
+        acumulado = 0
+        for limite, contagem in zip(BUCKETS_LATENCIA, contagens):
+            acumulado += contagem
+            linhas.append(f'desafio_latencia_segundos_bucket{{funcao="{nome}",le="{limite}"}} {acumulado}')
+        acumulado += contagens[-1]
+        linhas.append(f'desafio_latencia_segundos_bucket{{funcao="{nome}",le="+Inf"}} {acumulado}')
+        linhas.append(f'desafio_latencia_segundos_sum{{funcao="{nome}"}} {soma}')
+        linhas.append(f'desafio_latencia_segundos_count{{funcao="{nome}"}} {acumulado}')
+    
+    linhas += [
+        '# HELP desafio_tabela_dp_celulas Células das tabelas de programação dinâmica.',
+        '# TYPE desafio_tabela_dp_celulas summary',
+    ]
+    for nome, tabela in dados['tabelas_dp'].items():
+        linhas.append(f'desafio_tabela_dp_celulas_sum{{funcao="{nome}"}} {tabela["celulas_soma"]}')
+        linhas.append(f'desafio_tabela_dp_celulas_count{{funcao="{nome}"}} {tabela["quantidade"]}')
+    linhas += [
+        '# HELP desafio_tabela_dp_celulas_max Maior tabela de programação dinâmica.',
+        '# TYPE desafio_tabela_dp_celulas_max gauge',
+    ]
+    for nome, tabela in dados['tabelas_dp'].items():
+        linhas.append(f'desafio_tabela_dp_celulas_max{{funcao="{nome}"}} {tabela["celulas_max"]}')
+    
+    for metrica, tipo, descricao in [
+        ('hits', 'counter', 'Acertos do cache.'),
+        ('misses', 'counter', 'Faltas do cache.'),
+        ('tamanho', 'gauge', 'Entradas no cache.'),
+        ('taxa_acerto', 'gauge', 'Taxa de acerto do cache.'),
+    ]:
+        nome_metrica = f'desafio_cache_{metrica}' + ('_total' if tipo == 'counter' else '')
+        linhas.append(f'# HELP {nome_metrica} {descricao}')
+        linhas.append(f'# TYPE {nome_metrica} {tipo}')
+        for nome, cache in dados['caches'].items():
+            linhas.append(f'{nome_metrica}{{cache="{nome}"}} {cache[metrica]}')
+    
+    return '\n'.join(linhas) + '\n'
+
+
+if __name__ == "__main__":
+    # Usa o módulo importado (o mesmo que as perguntas usam), não este __main__
+    import instrumentacao
+    import pergunta_1
+    import pergunta_3
+    import pergunta_4
+    from concurrent.futures import ProcessPoolExecutor
+    from datetime import date
+    from pergunta_4 import calcular_beneficios_resultado
+    
+    print("=== Testes da Instrumentação ===\n")
+    
+    instrumentacao.zerar()
+    instrumentacao.ativar()
+    for texto in ("BananaA", "Casa", "BA"):
+        pergunta_1.verifica_string(texto)
+    pergunta_3.analisa_tabuleiro(10)
+    pergunta_4.calcular_beneficios(3000.0, date(2023, 1, 15), date(2024, 6, 20))
+    # Importada antes de ativar, como em servidor.py
+    calcular_beneficios_resultado(3000.0, date(2023, 1, 15), date(2024, 6, 20))
+    
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        tabuleiro_no_pool = executor.submit(pergunta_3.analisa_tabuleiro, 10).result()
+    instrumentacao.desativar()
+    
+    status = "✓" if tabuleiro_no_pool[2] == 274 else "✗"
+    print(f"{status} analisa_tabuleiro instrumentada roda em um pool de processos: {tabuleiro_no_pool}")
+    
+    dados = json.loads(instrumentacao.exportar_json())
+    chamadas = {nome: funcao['chamadas'] for nome, funcao in dados['funcoes'].items()}
+    print(f"  Chamadas: {chamadas}")
+    
+    status = "✓" if chamadas.get('verifica_string') == 3 else "✗"
+    print(f"{status} verifica_string contada 3 vezes")
+    esperado = {'verifica_string': 3, 'analisa_tabuleiro': 1, 'calcular_beneficios': 1, 'calcular_beneficios_resultado': 1}
+    status = "✓" if chamadas == esperado else "✗"
+    print(f"{status} Cada ponto de entrada contado uma vez, sem chamadas internas duplicadas")
+    status = "✓" if 'calcular_caminho_otimo' in dados['tabelas_dp'] else "✗"
+    print(f"{status} Tabelas de programação dinâmica registradas: {sorted(dados['tabelas_dp'])}")
+    
+    prometheus = instrumentacao.exportar_prometheus()
+    esperado = 'desafio_chamadas_total{funcao="verifica_string"} 3'
+    status = "✓" if esperado in prometheus else "✗"
+    print(f"{status} Prometheus contém: {esperado}")
+    esperado = 'desafio_latencia_segundos_count{funcao="analisa_tabuleiro"} 1'
+    status = "✓" if esperado in prometheus else "✗"
+    print(f"{status} Prometheus contém: {esperado}")
+    
+    pergunta_1.verifica_string("BA")
+    status = "✓" if instrumentacao.coletar()['funcoes']['verifica_string']['chamadas'] == 3 else "✗"
+    print(f"{status} Após desativar: chamadas não são mais contadas")
@@ -6,7 +6,16 @@ Esta função verifica se uma string atende a dois critérios:
 - Termina com a letra 'A'
 """
 
+from collections import Counter
+from typing import Iterable, List, Optional
 
+from instrumentacao import instrumentar
+
+# Bytes lidos de cada vez ao processar um arquivo (shard)
+TAMANHO_BLOCO_LEITURA = 8 * 1024 * 1024
+
+
+@instrumentar
 def verifica_string(texto: str) -> bool:
     """
     Verifica se a string começa com 'B' e termina com 'A'.
@@ -58,6 +67,143 @@ def verifica_string_case_insensitive(texto: str) -> bool:
     return texto.upper().startswith('B') and texto.upper().endswith('A')
 
 
+def histograma_extremos(textos: Iterable[str]) -> Counter:
+    """
+    Conta os pares (primeiro caractere, último caractere) de vários textos.
+    
+    Textos vazios são contados na chave ('', '').
+    
+    Args:
+        textos (Iterable[str]): Textos a classificar
+        
+    Returns:
+        Counter: Contagem por par (primeiro, último)
+        
+    Examples:
+        >>> histograma_extremos(["BananaA", "Casa", "BA", ""])
+        Counter({('B', 'A'): 2, ('C', 'a'): 1, ('', ''): 1})
+    """
+    return Counter((texto[:1], texto[-1:]) for texto in textos)
+
+
+def histograma_bloco(bloco: str) -> Counter:
+    """
+    Conta os pares (primeiro, último) de um bloco com um registro por linha.
+    
+    Quebras de linha '\\r\\n' são tratadas como '\\n', então o '\\r' não
+    é contado como último caractere.
+    
+    Args:
+        bloco (str): Registros separados por '\\n' (sem '\\n' final obrigatório)
+        
+    Returns:
+        Counter: Contagem por par (primeiro, último); linhas vazias em ('', '')
+        
+    Examples:
+        >>> histograma_bloco("BA\\r\\nBxA\\r\\n\\r\\nC\\r\\n")
+        Counter({('B', 'A'): 2, ('', ''): 1, ('C', 'C'): 1})
+    """
+    if not bloco:
+        return Counter()
+    
+    registros = bloco.replace('\r\n', '\n').split('\n')
+    if not registros[-1]:
+        registros.pop()
+    return histograma_extremos(registros)
+
+
+def histograma_arquivo(caminho: str, codificacao: str = 'utf-8') -> Counter:
+    """
+    Conta os pares (primeiro, último) de um arquivo com um registro por linha.
+    
+    O arquivo é lido em blocos de tamanho fixo, cortados na última quebra de
+    linha, então a memória usada não depende do tamanho do arquivo.
+    
+    Args:
+        caminho (str): Arquivo (shard) a processar
+        codificacao (str): Codificação do arquivo
+        
+    Returns:
+        Counter: Contagem por par (primeiro, último)
+    """
+    histograma = Counter()
+    resto = b''
+    with open(caminho, 'rb') as arquivo:
+        while True:
+            dados = arquivo.read(TAMANHO_BLOCO_LEITURA)
+            if not dados:
+                break
+            dados = resto + dados
+            corte = dados.rfind(b'\n') + 1
+            resto = dados[corte:]
+            histograma.update(histograma_bloco(dados[:corte].decode(codificacao, errors='replace')))
+    if resto:
+        histograma.update(histograma_bloco(resto.decode(codificacao, errors='replace')))
+    return histograma
+
+
+def histograma_arquivos(
+    caminhos: List[str],
+    processos: Optional[int] = None,
+    codificacao: str = 'utf-8'
+) -> Counter:
+    """
+    Conta os pares (primeiro, último) de vários arquivos em paralelo.
+    
+    Cada arquivo é processado em um processo do pool e as contagens
+    parciais são somadas.
+    
+    Args:
+        caminhos (List[str]): Arquivos (shards), de um ou mais corpora
+        processos (Optional[int]): Processos do pool (None usa o número de CPUs;
+            0 processa no processo atual)
+        codificacao (str): Codificação dos arquivos
+        
+    Returns:
+        Counter: Contagem total por par (primeiro, último)
+    """
+    histograma = Counter()
+    
+    if processos == 0:
+        for caminho in caminhos:
+            histograma.update(histograma_arquivo(caminho, codificacao))
+        return histograma
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        for parcial in executor.map(histograma_arquivo, caminhos, [codificacao] * len(caminhos)):
+            histograma.update(parcial)
+    return histograma
+
+
+def contar_verificados(histograma: Counter, case_insensitive: bool = False) -> int:
+    """
+    Deriva do histograma quantos registros passam em `verifica_string`.
+    
+    Um texto passa se e somente se seu par (primeiro, último) for ('B', 'A');
+    na versão case-insensitive, qualquer combinação de maiúsculas/minúsculas.
+    
+    Args:
+        histograma (Counter): Contagem por par (primeiro, último)
+        case_insensitive (bool): Usa a regra de `verifica_string_case_insensitive`
+        
+    Returns:
+        int: Número de registros aprovados
+        
+    Examples:
+        >>> contar_verificados(histograma_extremos(["BananaA", "Casa", "BA", "bola"]))
+        2
+    """
+    if not case_insensitive:
+        return histograma[('B', 'A')]
+    
+    return sum(
+        contagem for (primeiro, ultimo), contagem in histograma.items()
+        if primeiro.upper() == 'B' and ultimo.upper() == 'A'
+    )
+
+
 if __name__ == "__main__":
     # Testes
     print("=== Testes da Pergunta 1 ===\n")
@@ -93,4 +239,13 @@ if __name__ == "__main__":
         resultado = verifica_string_case_insensitive(texto)
         status = "✓" if resultado == esperado else "✗"
         print(f"{status} verifica_string_case_insensitive('{texto}') = {resultado} (esperado: {esperado})")
+    
+    print("\nHistograma (primeiro, último) dos casos de teste:")
+    histograma = histograma_extremos(texto for texto, _ in test_cases)
+    for par, contagem in histograma.most_common():
+        print(f"  {par}: {contagem}")
+    aprovados = contar_verificados(histograma)
+    esperados = sum(esperado for _, esperado in test_cases)
+    status = "✓" if aprovados == esperados else "✗"
+    print(f"{status} Aprovados pelo histograma: {aprovados} (esperado: {esperados})")
 
@@ -9,7 +9,10 @@ Sequência: 11, 18, 25, 32, 39...
 Esta função calcula o valor na posição x da sequência.
 """
 
+from instrumentacao import instrumentar
 
+
+@instrumentar
 def print_valor(x: int) -> int:
     """
     Calcula o valor na posição x da sequência aritmética.
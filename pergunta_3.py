@@ -13,10 +13,13 @@ A função calcula:
 3. Número de combinações de movimentos sem looping
 """
 
-from typing import Tuple
+from typing import Optional, Tuple, Union
 from functools import lru_cache
 
+from instrumentacao import instrumentar, metricas, registrar_lru_cache, registrar_tabela
 
+
+@instrumentar
 def analisa_tabuleiro(n_casas: int) -> Tuple[int, float, int]:
     """
     Analisa o tabuleiro e retorna as métricas solicitadas.
@@ -73,6 +76,8 @@ def calcular_caminho_otimo(n_casas: int) -> int:
     # Começamos na posição 0 (antes do tabuleiro)
     dp = [float('inf')] * (n_casas + 1)
     dp[0] = 0
+    if metricas.ativo:
+        registrar_tabela('calcular_caminho_otimo', len(dp))
     
     for posicao in range(n_casas + 1):
         if dp[posicao] == float('inf'):
@@ -145,6 +150,9 @@ def contar_caminhos_otimos(n_casas: int, turnos: int) -> int:
     return count
 
 
+registrar_lru_cache('contar_caminhos_otimos', contar_caminhos_otimos)
+
+
 def calcular_combinacoes_sem_looping(n_casas: int) -> int:
     """
     Calcula quantas combinações de movimentos diferentes um jogador
@@ -162,6 +170,8 @@ def calcular_combinacoes_sem_looping(n_casas: int) -> int:
     # dp[i] = número de formas de chegar na casa i (começando de 0)
     dp = [0] * (n_casas + 1)
     dp[0] = 1  # Uma forma de estar na posição inicial (não fazer nada)
+    if metricas.ativo:
+        registrar_tabela('calcular_combinacoes_sem_looping', len(dp))
     
     for posicao in range(n_casas):
         if dp[posicao] == 0:
@@ -181,6 +191,217 @@ def calcular_combinacoes_sem_looping(n_casas: int) -> int:
     return dp[n_casas]
 
 
+# Abaixo deste tamanho (em bits) as multiplicações são feitas no próprio processo:
+# o custo de enviar os números ao pool supera o ganho
+LIMITE_BITS_PARALELO = 1 << 18
+
+
+def calcular_caminho_otimo_direto(n_casas: int) -> int:
+    """
+    Número mínimo de turnos em O(1): cada turno anda no máximo 3 casas.
+    
+    Args:
+        n_casas (int): Número de casas do tabuleiro
+        
+    Returns:
+        int: Número mínimo de turnos (igual a `calcular_caminho_otimo`)
+    """
+    return -(-n_casas // 3)
+
+
+def contar_caminhos_otimos_direto(n_casas: int) -> int:
+    """
+    Conta os caminhos ótimos em O(1), sem recursão.
+    
+    Com k = ceil(n/3) turnos, cada passo é 3 menos uma "falta" de 0 a 2, e as
+    faltas somam d = 3k - n (0, 1 ou 2). Há 1 forma para d = 0, k formas para
+    d = 1 e k + k(k-1)/2 formas para d = 2 (uma falta de 2 ou duas de 1).
+    
+    Args:
+        n_casas (int): Número de casas do tabuleiro
+        
+    Returns:
+        int: Número de caminhos ótimos (igual a `contar_caminhos_otimos`)
+    """
+    turnos = calcular_caminho_otimo_direto(n_casas)
+    falta = 3 * turnos - n_casas
+    if falta == 0:
+        return 1
+    if falta == 1:
+        return turnos
+    return turnos + turnos * (turnos - 1) // 2
+
+
+class _PoolSobDemanda:
+    """Cria o pool de processos só quando um cálculo precisar dele"""
+    
+    __slots__ = ('processos', '_executor')
+    
+    def __init__(self, processos: Optional[int]) -> None:
+        self.processos = processos
+        self._executor = None
+    
+    def obter(self):
+        if self._executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=self.processos)
+        return self._executor
+    
+    def encerrar(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def _quadrados(valores: list, pool: Optional[_PoolSobDemanda]) -> list:
+    """Eleva os valores ao quadrado, no pool quando os números são grandes"""
+    if pool is None or max(valor.bit_length() for valor in valores) < LIMITE_BITS_PARALELO:
+        return [valor * valor for valor in valores]
+    # Cada tarefa recebe um único número: cada operando é enviado ao pool uma vez
+    executor = pool.obter()
+    futuros = [executor.submit(pow, valor, 2) for valor in valores]
+    return [futuro.result() for futuro in futuros]
+
+
+def _quadrado_mod_caracteristico(
+    polinomio: Tuple[int, int, int],
+    pool: Optional[_PoolSobDemanda]
+) -> Tuple[int, int, int]:
+    """
+    Eleva ao quadrado c0 + c1·x + c2·x² módulo x³ - x² - x - 1.
+    
+    Usa 6 quadrados independentes: os produtos cruzados saem de
+    2·ai·aj = (ai + aj)² - ai² - aj². A redução usa x³ = x² + x + 1 e
+    x⁴ = 2x² + 2x + 1 e só tem somas.
+    """
+    a0, a1, a2 = polinomio
+    q0, q1, q2, s01, s02, s12 = _quadrados(
+        [a0, a1, a2, a0 + a1, a0 + a2, a1 + a2], pool
+    )
+    d1, d2, d3, d4 = s01 - q0 - q1, s02 - q0 - q2 + q1, s12 - q1 - q2, q2
+    return q0 + d3 + d4, d1 + d3 + 2 * d4, d2 + d3 + 2 * d4
+
+
+def calcular_combinacoes_sem_looping_grande(n_casas: int, processos: Optional[int] = None) -> int:
+    """
+    Calcula as combinações sem looping para tabuleiros muito grandes.
+    
+    As combinações seguem T(n) = T(n-1) + T(n-2) + T(n-3), com T(0) = 1,
+    T(1) = 1 e T(2) = 2. Em vez de n somas de números com milhões de
+    dígitos, calcula xⁿ módulo o polinômio característico x³ - x² - x - 1
+    dividindo o expoente ao meio a cada passo (O(log n) quadrados). As
+    multiplicações de cada quadrado são independentes e, para números
+    grandes, rodam em um pool de processos, criado apenas se algum quadrado
+    passar de `LIMITE_BITS_PARALELO` bits.
+    
+    Args:
+        n_casas (int): Número de casas do tabuleiro (mínimo 0)
+        processos (Optional[int]): Processos do pool (None usa o número de
+            CPUs; 0 calcula no processo atual)
+            
+    Returns:
+        int: Número de combinações (igual a `calcular_combinacoes_sem_looping`)
+        
+    Raises:
+        ValueError: Se n_casas for negativo
+    """
+    if n_casas < 0:
+        raise ValueError("O número de casas não pode ser negativo")
+    
+    if processos == 0:
+        return _combinacoes_por_expoente(n_casas, None)
+    
+    pool = _PoolSobDemanda(processos)
+    try:
+        return _combinacoes_por_expoente(n_casas, pool)
+    finally:
+        pool.encerrar()
+
+
+def _combinacoes_por_expoente(n_casas: int, pool: Optional[_PoolSobDemanda]) -> int:
+    # xⁿ mod (x³ - x² - x - 1), bit a bit do mais significativo
+    polinomio = (1, 0, 0)
+    for bit in bin(n_casas)[2:]:
+        polinomio = _quadrado_mod_caracteristico(polinomio, pool)
+        if bit == '1':
+            # Multiplicar por x: c2·x³ vira c2·(x² + x + 1)
+            c0, c1, c2 = polinomio
+            polinomio = (c2, c0 + c2, c1 + c2)
+    
+    # T(n) = c0·T(0) + c1·T(1) + c2·T(2)
+    c0, c1, c2 = polinomio
+    return c0 + c1 + 2 * c2
+
+
+def serializar_inteiro(valor: int, formato: str = 'hex') -> Union[str, bytes, int]:
+    """
+    Serializa um inteiro grande sem convertê-lo para decimal.
+    
+    A conversão para decimal é quadrática no número de dígitos (e, a partir
+    do Python 3.11, limitada por padrão a 4300 dígitos); hexadecimal e bytes
+    são lineares.
+    
+    Args:
+        valor (int): Inteiro não negativo
+        formato (str): 'hex' (texto sem prefixo), 'bytes' (big-endian) ou 'int'
+        
+    Returns:
+        Union[str, bytes, int]: Valor serializado
+        
+    Raises:
+        ValueError: Se o formato for desconhecido
+    """
+    if formato == 'hex':
+        return format(valor, 'x')
+    if formato == 'bytes':
+        return valor.to_bytes(max(1, (valor.bit_length() + 7) // 8), 'big')
+    if formato == 'int':
+        return valor
+    raise ValueError(f"Formato desconhecido: {formato}")
+
+
+def analisa_tabuleiro_grande(
+    n_casas: int,
+    processos: Optional[int] = None,
+    formato: str = 'hex'
+) -> Tuple[int, int, Union[str, bytes, int]]:
+    """
+    Analisa tabuleiros muito grandes (10^7 casas ou mais) com resultados exatos.
+    
+    A probabilidade do caminho ótimo é caminhos_otimos / 3^turnos; como
+    o denominador tem milhões de dígitos (e o float seria 0.0), ela é
+    retornada pelos seus dois componentes exatos.
+    
+    Args:
+        n_casas (int): Número de casas do tabuleiro (mínimo 3)
+        processos (Optional[int]): Processos do pool (None usa o número de
+            CPUs; 0 calcula no processo atual)
+        formato (str): Formato das combinações ('hex', 'bytes' ou 'int')
+        
+    Returns:
+        Tuple[int, int, Union[str, bytes, int]]:
+            - Número mínimo de turnos (caminho ótimo)
+            - Número de caminhos ótimos (probabilidade = caminhos / 3^turnos)
+            - Número de combinações sem looping, serializado
+            
+    Raises:
+        ValueError: Se n_casas < 3 ou o formato for desconhecido
+        
+    Examples:
+        >>> analisa_tabuleiro_grande(10, processos=0, formato='int')
+        (4, 10, 274)
+    """
+    if n_casas < 3:
+        raise ValueError("O tabuleiro deve ter no mínimo 3 casas")
+    
+    combinacoes = calcular_combinacoes_sem_looping_grande(n_casas, processos)
+    return (
+        calcular_caminho_otimo_direto(n_casas),
+        contar_caminhos_otimos_direto(n_casas),
+        serializar_inteiro(combinacoes, formato)
+    )
+
+
 def mostrar_detalhes(n_casas: int) -> None:
     """
     Mostra análise detalhada do tabuleiro.
@@ -225,4 +446,15 @@ if __name__ == "__main__":
     for n in [3, 5, 10, 15, 20]:
         turnos, prob, comb = analisa_tabuleiro(n)
         print(f"{n:<8} {turnos:<10} {prob:<20.10f} {comb:<15}")
+    
+    # Tabuleiros muito grandes: resultado exato serializado em hexadecimal
+    print("\n" + "="*60)
+    print("Tabuleiro grande (modo exato)")
+    print("="*60)
+    n = 1_000_000
+    turnos, caminhos, comb_hex = analisa_tabuleiro_grande(n, processos=0)
+    print(f"Casas: {n:,}")
+    print(f"Turnos: {turnos:,}")
+    print(f"Probabilidade: {caminhos:,} / 3^{turnos:,}")
+    print(f"Combinações: {len(comb_hex) * 4:,} bits (hex: {comb_hex[:16]}...{comb_hex[-16:]})")
 
@@ -18,10 +18,18 @@ Décimo Terceiro:
 - Considera-se mês trabalhado se trabalhou 15 dias ou mais
 """
 
+import pickle
+from array import array
+from bisect import bisect_right
+from calendar import monthrange
+from collections import OrderedDict
 from datetime import datetime, date
-from typing import Tuple
+from typing import Dict, Hashable, Iterable, Iterator, Optional, Tuple
 
+from instrumentacao import instrumentar, registrar_cache
 
+
+@instrumentar
 def calcular_beneficios(
     salario: float,
     data_admissao: date,
@@ -48,6 +56,38 @@ def calcular_beneficios(
         >>> calcular_beneficios(3000, date(2023, 1, 15), date(2024, 6, 20))
         (1750.0, 1500.0, {...})
     """
+    return _calcular_resultado(salario, data_admissao, data_demissao).como_tupla()
+
+
+@instrumentar
+def calcular_beneficios_resultado(
+    salario: float,
+    data_admissao: date,
+    data_demissao: date
+) -> 'ResultadoBeneficios':
+    """
+    Calcula férias e décimo terceiro proporcionais sem montar os detalhes.
+    
+    Mesmo cálculo de `calcular_beneficios`, mas retorna um
+    `ResultadoBeneficios` que guarda apenas números e datas; o dicionário
+    de detalhes e as datas formatadas são gerados somente quando pedidos.
+    
+    Args:
+        salario (float): Salário bruto mensal do funcionário
+        data_admissao (date): Data de admissão do funcionário
+        data_demissao (date): Data de demissão do funcionário
+        
+    Returns:
+        ResultadoBeneficios: Resultado do cálculo
+        
+    Raises:
+        ValueError: Se data_demissao for anterior a data_admissao ou salário for negativo
+    """
+    return _calcular_resultado(salario, data_admissao, data_demissao)
+
+
+def _calcular_resultado(salario: float, data_admissao: date, data_demissao: date) -> 'ResultadoBeneficios':
+    # Corpo sem instrumentação, usado pelos pontos de entrada e pelos cálculos em lote
     # Validações
     if data_demissao < data_admissao:
         raise ValueError("Data de demissão não pode ser anterior à data de admissão")
@@ -55,23 +95,241 @@ def calcular_beneficios(
     if salario < 0:
         raise ValueError("Salário não pode ser negativo")
     
-    # Calcular férias
-    valor_ferias, detalhes_ferias = calcular_ferias(salario, data_admissao, data_demissao)
+    # Períodos dependem só do par de datas; o salário entra apenas na multiplicação
+    ultimo_aniversario, meses_ferias, data_inicial, meses_decimo = cache_periodos.obter(
+        data_admissao, data_demissao
+    )
+    
+    return ResultadoBeneficios(
+        salario, data_admissao, data_demissao,
+        ultimo_aniversario, meses_ferias, (meses_ferias / 12) * salario,
+        data_inicial, meses_decimo, (meses_decimo / 12) * salario
+    )
+
+
+class ResultadoBeneficios:
+    """
+    Resultado compacto de um cálculo de benefícios.
+    
+    Guarda os valores brutos e as datas do cálculo em `__slots__`. Os
+    valores arredondados são calculados na criação; o dicionário
+    `detalhes` (com as datas formatadas) só é montado quando acessado.
     
-    # Calcular décimo terceiro
-    valor_decimo, detalhes_decimo = calcular_decimo_terceiro(salario, data_admissao, data_demissao)
+    Para compatibilidade, o resultado pode ser desempacotado como a tupla
+    (valor_ferias, valor_decimo, detalhes) de `calcular_beneficios`.
     
-    # Montar detalhes completos
-    detalhes = {
-        'salario': salario,
-        'data_admissao': data_admissao.strftime('%d/%m/%Y'),
-        'data_demissao': data_demissao.strftime('%d/%m/%Y'),
-        'ferias': detalhes_ferias,
-        'decimo_terceiro': detalhes_decimo,
-        'total_a_receber': valor_ferias + valor_decimo
-    }
+    Examples:
+        >>> resultado = calcular_beneficios_resultado(3000, date(2023, 1, 15), date(2024, 6, 20))
+        >>> resultado.valor_ferias, resultado.valor_decimo
+        (1666.67, 1500.0)
+    """
     
-    return valor_ferias, valor_decimo, detalhes
+    __slots__ = (
+        'salario', 'data_admissao', 'data_demissao',
+        'ultimo_aniversario', 'meses_ferias', 'ferias_proporcionais',
+        'data_inicial_decimo', 'meses_decimo', 'decimo_proporcional',
+        'valor_ferias', 'valor_decimo'
+    )
+    
+    def __init__(
+        self,
+        salario: float,
+        data_admissao: date,
+        data_demissao: date,
+        ultimo_aniversario: date,
+        meses_ferias: int,
+        ferias_proporcionais: float,
+        data_inicial_decimo: date,
+        meses_decimo: int,
+        decimo_proporcional: float
+    ) -> None:
+        self.salario = salario
+        self.data_admissao = data_admissao
+        self.data_demissao = data_demissao
+        self.ultimo_aniversario = ultimo_aniversario
+        self.meses_ferias = meses_ferias
+        self.ferias_proporcionais = ferias_proporcionais
+        self.data_inicial_decimo = data_inicial_decimo
+        self.meses_decimo = meses_decimo
+        self.decimo_proporcional = decimo_proporcional
+        self.valor_ferias = round(ferias_proporcionais + ferias_proporcionais / 3, 2)
+        self.valor_decimo = round(decimo_proporcional, 2)
+    
+    @property
+    def total_a_receber(self) -> float:
+        """float: Soma de férias e décimo terceiro"""
+        return self.valor_ferias + self.valor_decimo
+    
+    @property
+    def detalhes(self) -> dict:
+        """dict: Detalhes do cálculo no formato de `calcular_beneficios`"""
+        adicional_um_terco = self.ferias_proporcionais / 3
+        return {
+            'salario': self.salario,
+            'data_admissao': self.data_admissao.strftime('%d/%m/%Y'),
+            'data_demissao': self.data_demissao.strftime('%d/%m/%Y'),
+            'ferias': {
+                'ultimo_aniversario': self.ultimo_aniversario.strftime('%d/%m/%Y'),
+                'meses_trabalhados': self.meses_ferias,
+                'ferias_proporcionais': round(self.ferias_proporcionais, 2),
+                'adicional_um_terco': round(adicional_um_terco, 2),
+                'valor_total': self.valor_ferias
+            },
+            'decimo_terceiro': {
+                'ano_referencia': self.data_demissao.year,
+                'data_inicial': self.data_inicial_decimo.strftime('%d/%m/%Y'),
+                'meses_trabalhados': self.meses_decimo,
+                'valor_proporcional': self.valor_decimo
+            },
+            'total_a_receber': self.total_a_receber
+        }
+    
+    def como_tupla(self) -> Tuple[float, float, dict]:
+        """
+        Converte para o formato de retorno de `calcular_beneficios`.
+        
+        Returns:
+            Tuple[float, float, dict]: Férias, décimo terceiro e detalhes
+        """
+        return self.valor_ferias, self.valor_decimo, self.detalhes
+    
+    def __iter__(self):
+        return iter(self.como_tupla())
+    
+    def __repr__(self) -> str:
+        return (
+            f"ResultadoBeneficios(valor_ferias={self.valor_ferias!r}, "
+            f"valor_decimo={self.valor_decimo!r})"
+        )
+
+
+def calcular_beneficios_lote(
+    registros: Iterable[Tuple[float, date, date]]
+) -> Iterator[ResultadoBeneficios]:
+    """
+    Calcula os benefícios de vários funcionários.
+    
+    Funcionários com o mesmo par de datas reaproveitam os períodos do
+    `cache_periodos`, restando apenas a multiplicação pelo salário.
+    
+    Args:
+        registros (Iterable[Tuple[float, date, date]]): Linhas
+            (salário, data de admissão, data de demissão)
+            
+    Yields:
+        ResultadoBeneficios: Resultado de cada registro, na mesma ordem
+    """
+    for salario, data_admissao, data_demissao in registros:
+        yield _calcular_resultado(salario, data_admissao, data_demissao)
+
+
+def calcular_periodos(data_admissao: date, data_demissao: date) -> Tuple[date, int, date, int]:
+    """
+    Calcula os períodos de férias e décimo terceiro de um par de datas.
+    
+    Args:
+        data_admissao (date): Data de admissão
+        data_demissao (date): Data de demissão
+        
+    Returns:
+        Tuple[date, int, date, int]:
+            - Último aniversário de emprego
+            - Meses proporcionais de férias
+            - Data inicial do décimo terceiro
+            - Meses proporcionais de décimo terceiro
+    """
+    ultimo_aniversario = encontrar_ultimo_aniversario(data_admissao, data_demissao)
+    meses_ferias = calcular_meses_proporcionais(ultimo_aniversario, data_demissao)
+    
+    data_inicial = max(data_admissao, date(data_demissao.year, 1, 1))
+    meses_decimo = calcular_meses_proporcionais(data_inicial, data_demissao)
+    
+    return ultimo_aniversario, meses_ferias, data_inicial, meses_decimo
+
+
+class CachePeriodos:
+    """
+    Cache LRU limitado dos períodos calculados por par de datas.
+    
+    Admissões e demissões em massa fazem muitos funcionários compartilharem
+    o mesmo par de datas. Como os períodos não dependem do salário, o
+    resultado de `calcular_periodos` é guardado pela chave normalizada
+    (ordinal da admissão, ordinal da demissão).
+    
+    Não é seguro para uso concorrente por várias threads.
+    
+    Examples:
+        >>> cache = CachePeriodos(maxsize=2)
+        >>> cache.obter(date(2023, 1, 15), date(2024, 6, 20))
+        (datetime.date(2024, 1, 15), 5, datetime.date(2024, 1, 1), 6)
+        >>> cache.estatisticas()['misses']
+        1
+    """
+    
+    __slots__ = ('maxsize', '_entradas', 'hits', 'misses', 'evictions')
+    
+    def __init__(self, maxsize: int = 65536) -> None:
+        if maxsize < 1:
+            raise ValueError("O tamanho máximo do cache deve ser maior ou igual a 1")
+        self.maxsize = maxsize
+        self._entradas: 'OrderedDict[Tuple[int, int], Tuple[date, int, date, int]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def obter(self, data_admissao: date, data_demissao: date) -> Tuple[date, int, date, int]:
+        """
+        Retorna os períodos do par de datas, calculando-os se necessário.
+        
+        Args:
+            data_admissao (date): Data de admissão
+            data_demissao (date): Data de demissão
+            
+        Returns:
+            Tuple[date, int, date, int]: Mesmo retorno de `calcular_periodos`
+        """
+        chave = (data_admissao.toordinal(), data_demissao.toordinal())
+        entradas = self._entradas
+        periodos = entradas.get(chave)
+        if periodos is not None:
+            self.hits += 1
+            entradas.move_to_end(chave)
+            return periodos
+        
+        self.misses += 1
+        periodos = calcular_periodos(data_admissao, data_demissao)
+        entradas[chave] = periodos
+        if len(entradas) > self.maxsize:
+            entradas.popitem(last=False)
+            self.evictions += 1
+        return periodos
+    
+    def estatisticas(self) -> dict:
+        """
+        Retorna as estatísticas de uso do cache.
+        
+        Returns:
+            dict: hits, misses, evictions, tamanho atual e tamanho máximo
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'tamanho': len(self._entradas),
+            'maxsize': self.maxsize
+        }
+    
+    def limpar(self) -> None:
+        """Remove todas as entradas e zera as estatísticas."""
+        self._entradas.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+# Cache compartilhado por calcular_beneficios e pelos cálculos em lote
+cache_periodos = CachePeriodos()
+registrar_cache('cache_periodos', cache_periodos.estatisticas)
 
 
 def calcular_ferias(
@@ -226,6 +484,589 @@ def calcular_meses_proporcionais(data_inicial: date, data_final: date) -> int:
     return max(0, meses)
 
 
+class HistoricoSalarial:
+    """
+    Histórico de salários de um funcionário em armazenamento colunar.
+    
+    As datas de vigência (ordinais) e os valores ficam em dois `array`
+    paralelos, sem um objeto por entrada. A consulta do salário vigente
+    em uma data usa `bisect` e custa O(log k) para k reajustes.
+    
+    Examples:
+        >>> historico = HistoricoSalarial()
+        >>> historico.adicionar(date(2023, 1, 15), 3000.0)
+        >>> historico.adicionar(date(2024, 3, 1), 3300.0)
+        >>> historico.salario_em(date(2024, 2, 10))
+        3000.0
+    """
+    
+    __slots__ = ('_datas', '_valores')
+    
+    def __init__(self) -> None:
+        self._datas = array('l')
+        self._valores = array('d')
+    
+    @classmethod
+    def de_colunas(cls, datas: Iterable[date], valores: Iterable[float]) -> 'HistoricoSalarial':
+        """
+        Cria um histórico a partir de colunas de datas e valores.
+        
+        Args:
+            datas (Iterable[date]): Datas de vigência em ordem cronológica
+            valores (Iterable[float]): Salários correspondentes
+            
+        Returns:
+            HistoricoSalarial: Histórico preenchido
+        """
+        historico = cls()
+        for data_vigencia, valor in zip(datas, valores):
+            historico.adicionar(data_vigencia, valor)
+        return historico
+    
+    def adicionar(self, data_vigencia: date, valor: float) -> None:
+        """
+        Registra um salário a partir da data de vigência.
+        
+        Um novo valor na mesma data do último registro o substitui.
+        
+        Args:
+            data_vigencia (date): Data a partir da qual o salário vale
+            valor (float): Salário bruto mensal
+            
+        Raises:
+            ValueError: Se o valor for negativo ou a data anterior ao último registro
+        """
+        if valor < 0:
+            raise ValueError("Salário não pode ser negativo")
+        
+        ordinal = data_vigencia.toordinal()
+        if self._datas and ordinal <= self._datas[-1]:
+            if ordinal < self._datas[-1]:
+                raise ValueError("Reajustes devem ser registrados em ordem cronológica")
+            self._valores[-1] = valor
+            return
+        
+        self._datas.append(ordinal)
+        self._valores.append(valor)
+    
+    def salario_em(self, data_referencia: date) -> float:
+        """
+        Retorna o salário vigente em uma data.
+        
+        Args:
+            data_referencia (date): Data de consulta
+            
+        Returns:
+            float: Salário vigente na data
+            
+        Raises:
+            ValueError: Se não houver salário vigente na data
+        """
+        indice = bisect_right(self._datas, data_referencia.toordinal()) - 1
+        if indice < 0:
+            raise ValueError(
+                f"Não há salário vigente em {data_referencia.strftime('%d/%m/%Y')}"
+            )
+        return self._valores[indice]
+    
+    def copiar(self) -> 'HistoricoSalarial':
+        """
+        Retorna uma cópia independente do histórico.
+        
+        Returns:
+            HistoricoSalarial: Histórico com as mesmas entradas
+        """
+        copia = HistoricoSalarial()
+        copia._datas = array('l', self._datas)
+        copia._valores = array('d', self._valores)
+        return copia
+    
+    def __eq__(self, outro) -> bool:
+        if not isinstance(outro, HistoricoSalarial):
+            return NotImplemented
+        return self._datas == outro._datas and self._valores == outro._valores
+    
+    def __len__(self) -> int:
+        return len(self._datas)
+
+
+def carregar_historicos(
+    registros: Iterable[Tuple[Hashable, date, float]]
+) -> Dict[Hashable, HistoricoSalarial]:
+    """
+    Carrega em lote os históricos salariais de vários funcionários.
+    
+    Cada registro é anexado diretamente às colunas do histórico do
+    funcionário, então o resultado não guarda um objeto por reajuste.
+    
+    Args:
+        registros (Iterable[Tuple[Hashable, date, float]]): Linhas
+            (funcionário, data de vigência, salário), em ordem cronológica
+            para cada funcionário
+            
+    Returns:
+        Dict[Hashable, HistoricoSalarial]: Histórico por funcionário
+    """
+    historicos: Dict[Hashable, HistoricoSalarial] = {}
+    for funcionario, data_vigencia, valor in registros:
+        historico = historicos.get(funcionario)
+        if historico is None:
+            historico = historicos[funcionario] = HistoricoSalarial()
+        historico.adicionar(data_vigencia, valor)
+    return historicos
+
+
+def somar_meses(data_base: date, meses: int) -> date:
+    """
+    Soma meses a uma data, ajustando o dia ao fim do mês quando necessário.
+    
+    Args:
+        data_base (date): Data inicial
+        meses (int): Quantidade de meses a somar
+        
+    Returns:
+        date: Data resultante
+    """
+    indice_mes = data_base.month - 1 + meses
+    ano = data_base.year + indice_mes // 12
+    mes = indice_mes % 12 + 1
+    dia = min(data_base.day, monthrange(ano, mes)[1])
+    return date(ano, mes, dia)
+
+
+def calcular_proporcional_historico(
+    historico: HistoricoSalarial,
+    data_inicial: date,
+    data_final: date,
+    meses: int
+) -> float:
+    """
+    Calcula o valor proporcional (meses/12) * salário de um período
+    usando o salário vigente em cada mês.
+    
+    O mês i vai de data_inicial + i meses até a véspera do mês seguinte
+    (limitado a data_final), e usa o salário vigente no seu último dia.
+    Meses consecutivos com o mesmo salário são agrupados, de modo que um
+    histórico sem reajustes no período reproduz exatamente `calcular_ferias`
+    e `calcular_decimo_terceiro`.
+    
+    Args:
+        historico (HistoricoSalarial): Histórico salarial do funcionário
+        data_inicial (date): Início do período
+        data_final (date): Fim do período
+        meses (int): Meses proporcionais do período
+        
+    Returns:
+        float: Valor proporcional do período
+    """
+    valor = 0.0
+    salario_atual = None
+    meses_grupo = 0
+    for i in range(meses):
+        fim_mes = date.fromordinal(somar_meses(data_inicial, i + 1).toordinal() - 1)
+        salario = historico.salario_em(min(fim_mes, data_final))
+        if salario != salario_atual and meses_grupo:
+            valor += (meses_grupo / 12) * salario_atual
+            meses_grupo = 0
+        salario_atual = salario
+        meses_grupo += 1
+    if meses_grupo:
+        valor += (meses_grupo / 12) * salario_atual
+    return valor
+
+
+@instrumentar
+def calcular_beneficios_historico(
+    historico: HistoricoSalarial,
+    data_admissao: date,
+    data_demissao: date
+) -> Tuple[float, float, dict]:
+    """
+    Calcula férias e décimo terceiro usando o histórico salarial.
+    
+    Cada mês proporcional usa o salário vigente naquele mês, em vez de
+    um salário único para todo o período.
+    
+    Args:
+        historico (HistoricoSalarial): Histórico salarial do funcionário
+        data_admissao (date): Data de admissão do funcionário
+        data_demissao (date): Data de demissão do funcionário
+        
+    Returns:
+        Tuple[float, float, dict]: Mesmo formato de `calcular_beneficios`
+        
+    Raises:
+        ValueError: Se data_demissao for anterior a data_admissao ou não
+            houver salário vigente em algum mês do período
+    """
+    return _calcular_resultado_historico(
+        historico, data_admissao, data_demissao
+    ).como_tupla()
+
+
+@instrumentar
+def calcular_beneficios_historico_resultado(
+    historico: HistoricoSalarial,
+    data_admissao: date,
+    data_demissao: date
+) -> ResultadoBeneficios:
+    """
+    Versão de `calcular_beneficios_historico` que retorna `ResultadoBeneficios`.
+    
+    Args:
+        historico (HistoricoSalarial): Histórico salarial do funcionário
+        data_admissao (date): Data de admissão do funcionário
+        data_demissao (date): Data de demissão do funcionário
+        
+    Returns:
+        ResultadoBeneficios: Resultado do cálculo
+        
+    Raises:
+        ValueError: Se data_demissao for anterior a data_admissao ou não
+            houver salário vigente em algum mês do período
+    """
+    return _calcular_resultado_historico(historico, data_admissao, data_demissao)
+
+
+def _calcular_resultado_historico(
+    historico: HistoricoSalarial,
+    data_admissao: date,
+    data_demissao: date
+) -> ResultadoBeneficios:
+    if data_demissao < data_admissao:
+        raise ValueError("Data de demissão não pode ser anterior à data de admissão")
+    
+    ultimo_aniversario, meses_ferias, data_inicial, meses_decimo = cache_periodos.obter(
+        data_admissao, data_demissao
+    )
+    
+    # Férias: meses desde o último aniversário
+    ferias_proporcionais = calcular_proporcional_historico(
+        historico, ultimo_aniversario, data_demissao, meses_ferias
+    )
+    
+    # Décimo terceiro: meses no ano da demissão
+    decimo_proporcional = calcular_proporcional_historico(
+        historico, data_inicial, data_demissao, meses_decimo
+    )
+    
+    return ResultadoBeneficios(
+        historico.salario_em(data_demissao), data_admissao, data_demissao,
+        ultimo_aniversario, meses_ferias, ferias_proporcionais,
+        data_inicial, meses_decimo, decimo_proporcional
+    )
+
+
+class _Registro:
+    """Entradas de um funcionário no repositório e o último resultado calculado"""
+    
+    __slots__ = ('salario', 'data_admissao', 'data_demissao', 'resultado')
+    
+    def __init__(self, salario, data_admissao: date, data_demissao: date) -> None:
+        self.salario = salario
+        self.data_admissao = data_admissao
+        self.data_demissao = data_demissao
+        self.resultado: Optional[ResultadoBeneficios] = None
+    
+    def __getstate__(self):
+        return self.salario, self.data_admissao, self.data_demissao, self.resultado
+    
+    def __setstate__(self, estado) -> None:
+        self.salario, self.data_admissao, self.data_demissao, self.resultado = estado
+
+
+class RepositorioBeneficios:
+    """
+    Resultados de benefícios por funcionário com recálculo incremental.
+    
+    Cada resultado depende do salário (ou do histórico salarial) e das datas
+    de admissão e demissão do funcionário. Uma correção marca como pendente
+    apenas o funcionário afetado; `recalcular()` refaz somente os pendentes
+    e atualiza os totais da empresa por diferença (valor novo - valor antigo).
+    Assim, uma correção custa O(alterações), e não O(funcionários).
+    
+    Os totais são mantidos em centavos inteiros, sem acúmulo de erro de
+    arredondamento ao longo das correções.
+    
+    Históricos salariais são copiados ao entrar no repositório: alterar o
+    objeto do chamador não muda o registro; para aplicar a alteração,
+    passe o histórico novamente em `atualizar()`.
+    
+    Examples:
+        >>> repositorio = RepositorioBeneficios()
+        >>> repositorio.definir(1, 3000.0, date(2023, 1, 15), date(2024, 6, 20))
+        >>> repositorio.definir(2, 4000.0, date(2020, 5, 10), date(2024, 2, 15))
+        >>> repositorio.totais()['total_a_receber']
+        7833.34
+        >>> repositorio.atualizar(1, data_demissao=date(2024, 7, 20))
+        >>> repositorio.pendentes
+        1
+        >>> repositorio.totais()['total_a_receber']
+        8416.67
+    """
+    
+    def __init__(self) -> None:
+        self._registros: Dict[Hashable, _Registro] = {}
+        self._pendentes: set = set()
+        self._centavos_ferias = 0
+        self._centavos_decimo = 0
+    
+    def definir(self, funcionario: Hashable, salario, data_admissao: date, data_demissao: date) -> None:
+        """
+        Inclui ou substitui todas as entradas de um funcionário.
+        
+        Args:
+            funcionario (Hashable): Identificador do funcionário
+            salario (float | HistoricoSalarial): Salário mensal ou histórico salarial
+            data_admissao (date): Data de admissão
+            data_demissao (date): Data de demissão
+            
+        Raises:
+            ValueError: Se o salário for negativo ou a demissão anterior à admissão
+        """
+        registro = self._registros.get(funcionario)
+        if registro is None:
+            _validar_entradas(salario, data_admissao, data_demissao)
+            self._registros[funcionario] = _Registro(
+                _copiar_salario(salario), data_admissao, data_demissao
+            )
+            self._pendentes.add(funcionario)
+            return
+        self.atualizar(
+            funcionario, salario=salario,
+            data_admissao=data_admissao, data_demissao=data_demissao
+        )
+    
+    def atualizar(
+        self,
+        funcionario: Hashable,
+        salario=None,
+        data_admissao: Optional[date] = None,
+        data_demissao: Optional[date] = None
+    ) -> None:
+        """
+        Corrige entradas de um funcionário; só marca pendente se algo mudar.
+        
+        As entradas são validadas antes de qualquer alteração: uma correção
+        inválida é rejeitada e o registro fica como estava.
+        
+        Args:
+            funcionario (Hashable): Identificador do funcionário
+            salario (float | HistoricoSalarial, opcional): Novo salário ou histórico
+            data_admissao (date, opcional): Nova data de admissão
+            data_demissao (date, opcional): Nova data de demissão
+            
+        Raises:
+            KeyError: Se o funcionário não estiver no repositório
+            ValueError: Se o salário for negativo ou a demissão anterior à admissão
+        """
+        registro = self._registros[funcionario]
+        novo_salario = registro.salario if salario is None else salario
+        nova_admissao = registro.data_admissao if data_admissao is None else data_admissao
+        nova_demissao = registro.data_demissao if data_demissao is None else data_demissao
+        _validar_entradas(novo_salario, nova_admissao, nova_demissao)
+        
+        alterado = False
+        if novo_salario != registro.salario:
+            registro.salario = _copiar_salario(novo_salario)
+            alterado = True
+        if nova_admissao != registro.data_admissao:
+            registro.data_admissao = nova_admissao
+            alterado = True
+        if nova_demissao != registro.data_demissao:
+            registro.data_demissao = nova_demissao
+            alterado = True
+        
+        if alterado:
+            self._pendentes.add(funcionario)
+    
+    def registrar_reajuste(self, funcionario: Hashable, data_vigencia: date, valor: float) -> None:
+        """
+        Registra um reajuste no histórico salarial de um funcionário.
+        
+        Um salário fixo é convertido em histórico a partir da admissão. Como
+        os reajustes são registrados em ordem cronológica, um reajuste com
+        vigência posterior à demissão não altera o resultado e não o marca
+        como pendente.
+        
+        Args:
+            funcionario (Hashable): Identificador do funcionário
+            data_vigencia (date): Data a partir da qual o salário vale
+            valor (float): Novo salário mensal
+            
+        Raises:
+            KeyError: Se o funcionário não estiver no repositório
+            ValueError: Se o reajuste estiver fora de ordem ou for negativo
+        """
+        registro = self._registros[funcionario]
+        if not isinstance(registro.salario, HistoricoSalarial):
+            registro.salario = HistoricoSalarial.de_colunas(
+                [registro.data_admissao], [registro.salario]
+            )
+        
+        registro.salario.adicionar(data_vigencia, valor)
+        if data_vigencia <= registro.data_demissao:
+            self._pendentes.add(funcionario)
+    
+    def remover(self, funcionario: Hashable) -> None:
+        """
+        Remove um funcionário e desconta seu resultado dos totais.
+        
+        Args:
+            funcionario (Hashable): Identificador do funcionário
+            
+        Raises:
+            KeyError: Se o funcionário não estiver no repositório
+        """
+        registro = self._registros.pop(funcionario)
+        self._pendentes.discard(funcionario)
+        if registro.resultado is not None:
+            self._aplicar_diferenca(registro.resultado, -1)
+    
+    def recalcular(self) -> int:
+        """
+        Recalcula apenas os funcionários pendentes e atualiza os totais.
+        
+        Um funcionário cujo cálculo falha não impede os demais: ele continua
+        pendente, os totais continuam com o resultado anterior dele e a falha
+        é informada ao final.
+        
+        Returns:
+            int: Número de funcionários recalculados
+            
+        Raises:
+            ValueError: Se o cálculo de algum funcionário pendente falhar
+                (a mensagem lista todos eles)
+        """
+        recalculados = 0
+        falhas = []
+        for funcionario in list(self._pendentes):
+            try:
+                self._recalcular_funcionario(funcionario)
+            except ValueError as e:
+                falhas.append(str(e))
+                continue
+            recalculados += 1
+        
+        if falhas:
+            raise ValueError('; '.join(falhas))
+        return recalculados
+    
+    def _recalcular_funcionario(self, funcionario: Hashable) -> None:
+        """Recalcula um funcionário pendente e aplica a diferença nos totais"""
+        registro = self._registros[funcionario]
+        try:
+            novo = _calcular_registro(registro)
+        except ValueError as e:
+            raise ValueError(f"Funcionário {funcionario!r}: {e}") from e
+        
+        if registro.resultado is not None:
+            self._aplicar_diferenca(registro.resultado, -1)
+        self._aplicar_diferenca(novo, 1)
+        registro.resultado = novo
+        self._pendentes.discard(funcionario)
+    
+    def _aplicar_diferenca(self, resultado: ResultadoBeneficios, sinal: int) -> None:
+        self._centavos_ferias += sinal * round(resultado.valor_ferias * 100)
+        self._centavos_decimo += sinal * round(resultado.valor_decimo * 100)
+    
+    @property
+    def pendentes(self) -> int:
+        """int: Funcionários aguardando recálculo"""
+        return len(self._pendentes)
+    
+    def resultado(self, funcionario: Hashable) -> ResultadoBeneficios:
+        """
+        Retorna o resultado atualizado de um funcionário.
+        
+        Se ele estiver pendente, só ele é recalculado (os totais recebem a
+        diferença); os demais pendentes continuam como estão.
+        
+        Args:
+            funcionario (Hashable): Identificador do funcionário
+            
+        Returns:
+            ResultadoBeneficios: Resultado do cálculo
+            
+        Raises:
+            KeyError: Se o funcionário não estiver no repositório
+            ValueError: Se o cálculo deste funcionário falhar
+        """
+        if funcionario in self._pendentes:
+            self._recalcular_funcionario(funcionario)
+        return self._registros[funcionario].resultado
+    
+    def totais(self) -> dict:
+        """
+        Retorna os totais da empresa, recalculando os pendentes antes.
+        
+        Returns:
+            dict: funcionarios, total_ferias, total_decimo e total_a_receber
+        """
+        self.recalcular()
+        return {
+            'funcionarios': len(self._registros),
+            'total_ferias': self._centavos_ferias / 100,
+            'total_decimo': self._centavos_decimo / 100,
+            'total_a_receber': (self._centavos_ferias + self._centavos_decimo) / 100
+        }
+    
+    def __len__(self) -> int:
+        return len(self._registros)
+    
+    def salvar(self, caminho: str) -> None:
+        """
+        Salva o repositório (entradas, resultados e totais) em arquivo.
+        
+        Args:
+            caminho (str): Arquivo de destino
+        """
+        with open(caminho, 'wb') as arquivo:
+            pickle.dump(self, arquivo, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def carregar(cls, caminho: str) -> 'RepositorioBeneficios':
+        """
+        Carrega um repositório salvo com `salvar`.
+        
+        Só carregue arquivos de origem confiável (usa pickle).
+        
+        Args:
+            caminho (str): Arquivo salvo
+            
+        Returns:
+            RepositorioBeneficios: Repositório com os resultados já calculados
+        """
+        with open(caminho, 'rb') as arquivo:
+            repositorio = pickle.load(arquivo)
+        if not isinstance(repositorio, cls):
+            raise ValueError(f"Arquivo não contém um {cls.__name__}: {caminho}")
+        return repositorio
+
+
+def _validar_entradas(salario, data_admissao: date, data_demissao: date) -> None:
+    if not isinstance(salario, HistoricoSalarial) and salario < 0:
+        raise ValueError("Salário não pode ser negativo")
+    if data_demissao < data_admissao:
+        raise ValueError("Data de demissão não pode ser anterior à data de admissão")
+
+
+def _copiar_salario(salario):
+    if isinstance(salario, HistoricoSalarial):
+        return salario.copiar()
+    return salario
+
+
+def _calcular_registro(registro: _Registro) -> ResultadoBeneficios:
+    if isinstance(registro.salario, HistoricoSalarial):
+        return _calcular_resultado_historico(
+            registro.salario, registro.data_admissao, registro.data_demissao
+        )
+    return _calcular_resultado(
+        registro.salario, registro.data_admissao, registro.data_demissao
+    )
+
+
 def formatar_relatorio(salario: float, data_admissao: date, data_demissao: date) -> str:
     """
     Gera um relatório formatado dos cálculos.
@@ -326,4 +1167,75 @@ if __name__ == "__main__":
         data_admissao=date(2022, 3, 15),
         data_demissao=date(2024, 12, 31)
     ))
+    
+    # Teste 6: Histórico salarial com reajuste no meio do período
+    print("\nTESTE 6: Histórico salarial com reajuste")
+    historico = HistoricoSalarial.de_colunas(
+        [date(2023, 1, 15), date(2024, 4, 1)],
+        [3000.00, 3600.00]
+    )
+    ferias, decimo, _ = calcular_beneficios_historico(
+        historico, date(2023, 1, 15), date(2024, 6, 20)
+    )
+    print(f"  Férias (+ 1/3): R$ {ferias:,.2f} (esperado: R$ 1,866.67)")
+    print(f"  Décimo Terceiro: R$ {decimo:,.2f} (esperado: R$ 1,650.00)")
+    
+    # Teste 7: Lote com pares de datas repetidos reaproveita o cache
+    print("\nTESTE 7: Lote com datas repetidas")
+    cache_periodos.limpar()
+    lote = [(1000.0 + i, date(2023, 1, 15), date(2024, 6, 20)) for i in range(1000)]
+    total = sum(r.total_a_receber for r in calcular_beneficios_lote(lote))
+    print(f"  Total do lote: R$ {total:,.2f}")
+    print(f"  Cache: {cache_periodos.estatisticas()}")
+    
+    # Teste 8: Correção de um funcionário recalcula só ele
+    print("\nTESTE 8: Recálculo incremental após correção")
+    repositorio = RepositorioBeneficios()
+    for i, (salario, data_admissao, data_demissao) in enumerate(lote):
+        repositorio.definir(i, salario, data_admissao, data_demissao)
+    print(f"  Total inicial: R$ {repositorio.totais()['total_a_receber']:,.2f}")
+    repositorio.atualizar(0, data_demissao=date(2024, 7, 20))
+    repositorio.registrar_reajuste(1, date(2024, 3, 1), 1500.00)
+    print(f"  Recalculados após 2 correções: {repositorio.recalcular()} (esperado: 2)")
+    print(f"  Total corrigido: R$ {repositorio.totais()['total_a_receber']:,.2f}")
 
+    
+    # Teste 9: Histórico alterado pelo chamador e correção inválida
+    print("\nTESTE 9: Histórico alterado e correção inválida")
+    historico = HistoricoSalarial.de_colunas([date(2023, 1, 15)], [3000.00])
+    repositorio = RepositorioBeneficios()
+    repositorio.definir(1, historico, date(2023, 1, 15), date(2024, 6, 20))
+    repositorio.definir(2, 4000.00, date(2020, 5, 10), date(2024, 2, 15))
+    repositorio.recalcular()
+    historico.adicionar(date(2024, 2, 1), 6000.00)
+    repositorio.atualizar(1, salario=historico)
+    print(f"  Pendentes após alterar o histórico: {repositorio.pendentes} (esperado: 1)")
+    repositorio.recalcular()
+    novo = RepositorioBeneficios()
+    novo.definir(1, historico, date(2023, 1, 15), date(2024, 6, 20))
+    esperado = novo.totais()['total_a_receber']
+    obtido = repositorio.resultado(1).total_a_receber
+    print(f"  {'✓' if abs(obtido - esperado) < 0.005 else '✗'} Funcionário 1: R$ {obtido:,.2f} (esperado: R$ {esperado:,.2f})")
+    try:
+        repositorio.atualizar(2, data_demissao=date(2019, 1, 1))
+        print("  ✗ Demissão anterior à admissão foi aceita")
+    except ValueError as e:
+        print(f"  ✓ Correção rejeitada: {e}")
+    print(f"  Pendentes após correção rejeitada: {repositorio.pendentes} (esperado: 0)")
+    
+    # Teste 10: Consulta de um funcionário não depende dos outros pendentes
+    print("\nTESTE 10: Consulta recalcula só o funcionário pedido")
+    repositorio = RepositorioBeneficios()
+    sem_cobertura = HistoricoSalarial.de_colunas([date(2024, 3, 1)], [3000.00])
+    repositorio.definir(1, sem_cobertura, date(2023, 1, 15), date(2024, 6, 20))
+    repositorio.definir(2, 4000.00, date(2020, 5, 10), date(2024, 2, 15))
+    try:
+        resultado = repositorio.resultado(2)
+        print(f"  ✓ Funcionário 2: R$ {resultado.total_a_receber:,.2f}; pendentes: {repositorio.pendentes} (esperado: 1)")
+    except ValueError as e:
+        print(f"  ✗ Falha de outro funcionário impediu a consulta: {e}")
+    try:
+        repositorio.resultado(1)
+        print("  ✗ Histórico sem cobertura foi aceito")
+    except ValueError as e:
+        print(f"  ✓ Erro só na consulta do próprio funcionário: {e}")
@@ -0,0 +1,228 @@
+"""
+Processamento em lote das 4 perguntas via NDJSON
+
+Lê tarefas NDJSON da entrada padrão (uma por linha) e escreve os resultados
+em NDJSON na saída padrão, na mesma ordem. Cada tarefa informa a função e
+os argumentos (lista posicional e/ou objeto nomeado):
+
+    {"id": 1, "funcao": "verifica_string", "args": ["BananaA"]}
+    {"id": 2, "funcao": "print_valor", "args": [200]}
+    {"id": 3, "funcao": "analisa_tabuleiro", "args": [10]}
+    {"id": 4, "funcao": "calcular_beneficios",
+     "kwargs": {"salario": 3000, "data_admissao": "2023-01-15", "data_demissao": "2024-06-20"}}
+
+Resultados:
+
+    {"id": 1, "resultado": true}
+    {"id": 5, "erro": "ValueError: A posição deve ser maior ou igual a 1"}
+
+Os módulos das perguntas só são importados quando uma tarefa precisa deles.
+As linhas são agrupadas em blocos e distribuídas para um pool de processos;
+o número de blocos em andamento é limitado, então a memória não cresce com
+o tamanho da entrada.
+
+Uso:
+    python processar_lote.py < tarefas.ndjson > resultados.ndjson
+    python processar_lote.py --processos 4 --tamanho-bloco 1000 < tarefas.ndjson
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+from collections import deque
+from datetime import date
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+# funcao -> (módulo, atributo)
+FUNCOES: Dict[str, Tuple[str, str]] = {
+    'verifica_string': ('pergunta_1', 'verifica_string'),
+    'print_valor': ('pergunta_2', 'print_valor'),
+    'analisa_tabuleiro': ('pergunta_3', 'analisa_tabuleiro'),
+    'calcular_beneficios': ('pergunta_4', 'calcular_beneficios'),
+}
+
+# Argumentos recebidos como texto ISO 8601 e convertidos para date
+ARGUMENTOS_DATA = {'data_admissao', 'data_demissao'}
+
+_funcoes_carregadas: Dict[str, Callable] = {}
+
+
+def obter_funcao(nome: str) -> Callable:
+    """
+    Importa (uma única vez por processo) e retorna a função pedida.
+    
+    Args:
+        nome (str): Nome da função em FUNCOES
+    
+    Returns:
+        Callable: Função da pergunta correspondente
+    
+    Raises:
+        ValueError: Se a função não for suportada
+    """
+    funcao = _funcoes_carregadas.get(nome)
+    if funcao is None:
+        if nome not in FUNCOES:
+            raise ValueError(f"Função não suportada: {nome}")
+        modulo, atributo = FUNCOES[nome]
+        funcao = _funcoes_carregadas[nome] = getattr(importlib.import_module(modulo), atributo)
+    return funcao
+
+
+def _converter_argumentos(nome: str, args: list, kwargs: dict) -> Tuple[list, dict]:
+    """Converte as datas ISO 8601 de calcular_beneficios"""
+    if nome != 'calcular_beneficios':
+        return args, kwargs
+    args = args[:1] + [date.fromisoformat(valor) for valor in args[1:]]
+    kwargs = {
+        chave: date.fromisoformat(valor) if chave in ARGUMENTOS_DATA else valor
+        for chave, valor in kwargs.items()
+    }
+    return args, kwargs
+
+
+def _rejeitar_constante(nome: str):
+    """Recusa NaN, Infinity e -Infinity, que não são JSON válido"""
+    raise ValueError(f"Número não finito não é permitido: {nome}")
+
+
+def _serializar(valor):
+    """Converte tuplas em listas e datas em texto para o JSON de saída"""
+    if isinstance(valor, tuple):
+        return [_serializar(item) for item in valor]
+    if isinstance(valor, dict):
+        return {chave: _serializar(item) for chave, item in valor.items()}
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return valor
+
+
+def executar_tarefa(linha: str) -> str:
+    """
+    Executa uma tarefa NDJSON e retorna a linha de resultado.
+    
+    Erros de formato ou do cálculo viram um resultado com a chave "erro";
+    a execução do lote não é interrompida. Números não finitos (NaN,
+    Infinity) são recusados na entrada e na saída, para que toda linha
+    produzida seja JSON válido.
+    
+    Args:
+        linha (str): Tarefa em JSON
+    
+    Returns:
+        str: Resultado em JSON (sem quebra de linha)
+    
+    Examples:
+        >>> executar_tarefa('{"id": 1, "funcao": "verifica_string", "args": ["BananaA"]}')
+        '{"id": 1, "resultado": true}'
+        >>> executar_tarefa('{"id": 2, "funcao": "print_valor", "args": [0]}')
+        '{"id": 2, "erro": "ValueError: A posição deve ser maior ou igual a 1"}'
+        >>> executar_tarefa('{"id": 3, "funcao": "verifica_string", "args": [NaN]}')
+        '{"id": null, "erro": "ValueError: Número não finito não é permitido: NaN"}'
+    """
+    identificador = None
+    try:
+        tarefa = json.loads(linha, parse_constant=_rejeitar_constante)
+        identificador = tarefa.get('id')
+        nome = tarefa['funcao']
+        args, kwargs = _converter_argumentos(
+            nome, list(tarefa.get('args', [])), dict(tarefa.get('kwargs', {}))
+        )
+        resultado = obter_funcao(nome)(*args, **kwargs)
+        return json.dumps(
+            {'id': identificador, 'resultado': _serializar(resultado)},
+            ensure_ascii=False, allow_nan=False
+        )
+    except Exception as e:
+        return json.dumps({'id': identificador, 'erro': f"{type(e).__name__}: {e}"}, ensure_ascii=False)
+
+
+def executar_bloco(linhas: List[str]) -> str:
+    """
+    Executa um bloco de tarefas e retorna os resultados já unidos.
+    
+    Args:
+        linhas (List[str]): Tarefas em JSON
+    
+    Returns:
+        str: Resultados NDJSON, um por linha, terminando com quebra de linha
+    """
+    return ''.join(executar_tarefa(linha) + '\n' for linha in linhas)
+
+
+def _blocos(linhas: Iterable[str], tamanho_bloco: int) -> Iterator[List[str]]:
+    """Agrupa as linhas não vazias em blocos de tamanho fixo"""
+    linhas = (linha for linha in linhas if linha.strip())
+    while True:
+        bloco = list(islice(linhas, tamanho_bloco))
+        if not bloco:
+            return
+        yield bloco
+
+
+def processar(
+    entrada: Iterable[str],
+    saida,
+    processos: int = 0,
+    tamanho_bloco: int = 500
+) -> None:
+    """
+    Processa um fluxo de tarefas NDJSON e escreve os resultados em ordem.
+    
+    Args:
+        entrada (Iterable[str]): Linhas de tarefas
+        saida: Arquivo de texto aberto para escrita
+        processos (int): Processos do pool (0 executa no processo atual)
+        tamanho_bloco (int): Tarefas por bloco enviado a um processo
+    
+    Raises:
+        ValueError: Se processos for negativo ou tamanho_bloco menor que 1
+    """
+    if processos < 0:
+        raise ValueError("O número de processos deve ser maior ou igual a 0")
+    
+    if tamanho_bloco < 1:
+        raise ValueError("O tamanho do bloco deve ser maior ou igual a 1")
+    
+    blocos = _blocos(entrada, tamanho_bloco)
+    
+    if processos == 0:
+        for bloco in blocos:
+            saida.write(executar_bloco(bloco))
+        return
+    
+    from concurrent.futures import ProcessPoolExecutor
+    
+    # Limita os blocos em andamento para manter a memória constante
+    max_pendentes = processos * 2
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        pendentes = deque()
+        for bloco in blocos:
+            pendentes.append(executor.submit(executar_bloco, bloco))
+            if len(pendentes) >= max_pendentes:
+                saida.write(pendentes.popleft().result())
+        while pendentes:
+            saida.write(pendentes.popleft().result())
+
+
+def main() -> None:
+    """Interface de linha de comando do processamento em lote"""
+    parser = argparse.ArgumentParser(description="Processa tarefas NDJSON das 4 perguntas")
+    parser.add_argument(
+        '--processos', type=int, default=0,
+        help=f"Processos do pool; 0 executa no processo atual (disponíveis: {os.cpu_count()})"
+    )
+    parser.add_argument('--tamanho-bloco', type=int, default=500)
+    args = parser.parse_args()
+    
+    try:
+        processar(sys.stdin, sys.stdout, args.processos, args.tamanho_bloco)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
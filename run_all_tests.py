@@ -2,6 +2,7 @@
 Script para executar todos os testes do desafio
 """
 
+import json
 import sys
 
 
@@ -111,6 +112,218 @@ def main():
         print(f"\n❌ Erro na Pergunta 4: {e}")
         sys.exit(1)
     
+    # Instrumentação
+    print("\n\n" + "█"*70)
+    print("█ FERRAMENTAS: Instrumentação")
+    print("█"*70)
+    try:
+        import instrumentacao
+        import pergunta_1
+        import pergunta_3
+        from concurrent.futures import ProcessPoolExecutor
+        from datetime import date
+        from pergunta_4 import calcular_beneficios, calcular_beneficios_resultado
+        
+        instrumentacao.zerar()
+        instrumentacao.ativar()
+        try:
+            pergunta_1.verifica_string("BananaA")
+            pergunta_1.verifica_string("Casa")
+            calcular_beneficios(3000.00, date(2023, 1, 15), date(2024, 6, 20))
+            calcular_beneficios_resultado(3000.00, date(2023, 1, 15), date(2024, 6, 20))
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                tabuleiro_no_pool = executor.submit(pergunta_3.analisa_tabuleiro, 10).result()
+        finally:
+            instrumentacao.desativar()
+        
+        dados = json.loads(instrumentacao.exportar_json())
+        prometheus = instrumentacao.exportar_prometheus()
+        
+        verificacoes = [
+            ("verifica_string contada 2 vezes (JSON)",
+             dados['funcoes']['verifica_string']['chamadas'] == 2),
+            ("calcular_beneficios e calcular_beneficios_resultado contadas 1 vez cada",
+             dados['funcoes']['calcular_beneficios']['chamadas'] == 1
+             and dados['funcoes']['calcular_beneficios_resultado']['chamadas'] == 1),
+            ("Contador no formato Prometheus",
+             'desafio_chamadas_total{funcao="calcular_beneficios"} 1' in prometheus),
+            ("analisa_tabuleiro instrumentada roda em um pool de processos",
+             tabuleiro_no_pool[2] == 274),
+        ]
+        
+        print("\nTestes executados:")
+        for descricao, passou in verificacoes:
+            print(f"  {'✓ PASSOU' if passou else '✗ FALHOU'}: {descricao}")
+        if not all(passou for _, passou in verificacoes):
+            raise AssertionError("verificações da instrumentação falharam")
+        
+        print("\n✅ Instrumentação completada com sucesso!")
+    except Exception as e:
+        print(f"\n❌ Erro na Instrumentação: {e}")
+        sys.exit(1)
+    
+    # Processamento em lote
+    print("\n\n" + "█"*70)
+    print("█ FERRAMENTAS: Processamento em Lote (NDJSON)")
+    print("█"*70)
+    try:
+        import io
+        from processar_lote import processar
+        
+        tarefas = [
+            {"id": 1, "funcao": "verifica_string", "args": ["BananaA"]},
+            {"id": 2, "funcao": "print_valor", "args": [200]},
+            {"id": 3, "funcao": "analisa_tabuleiro", "args": [10]},
+            {"id": 4, "funcao": "calcular_beneficios",
+             "kwargs": {"salario": 3000, "data_admissao": "2023-01-15", "data_demissao": "2024-06-20"}},
+            {"id": 5, "funcao": "print_valor", "args": [0]},
+            {"id": 6, "funcao": "calcular_beneficios", "args": [float('nan'), "2023-01-15", "2024-06-20"]},
+        ]
+        # json.dumps escreve o salário da tarefa 6 como NaN, que deve virar linha de erro
+        entrada = [json.dumps(tarefa) + "\n" for tarefa in tarefas] * 3
+        # A tarefa com NaN não chega a ser lida, então sai sem id
+        ids_esperados = [1, 2, 3, 4, 5, None] * 3
+        
+        def recusar_constante(constante):
+            raise ValueError(constante)
+        
+        def json_estrito(linha):
+            try:
+                json.loads(linha, parse_constant=recusar_constante)
+            except ValueError:
+                return False
+            return True
+        
+        print("\nTestes executados:")
+        saidas = {}
+        for processos in (0, 2):
+            saida = io.StringIO()
+            processar(entrada, saida, processos=processos, tamanho_bloco=2)
+            saidas[processos] = saida.getvalue()
+            resultados = [json.loads(linha) for linha in saidas[processos].splitlines()]
+            
+            verificacoes = [
+                ("uma linha por tarefa, na ordem", [r['id'] for r in resultados] == ids_esperados),
+                ("verifica_string", resultados[0].get('resultado') is True),
+                ("print_valor", resultados[1].get('resultado') == 1404),
+                ("calcular_beneficios", resultados[3].get('resultado', [None])[0] == 1666.67),
+                ("linha de erro", resultados[4].get('erro', '').startswith('ValueError')),
+                ("NaN na entrada vira linha de erro", 'Número não finito' in resultados[5].get('erro', '')),
+                ("saída é JSON estrito (sem NaN/Infinity)",
+                 all(json_estrito(linha) for linha in saidas[processos].splitlines())),
+            ]
+            for descricao, passou in verificacoes:
+                print(f"  {'✓ PASSOU' if passou else '✗ FALHOU'}: processos={processos}: {descricao}")
+            if not all(passou for _, passou in verificacoes):
+                raise AssertionError(f"verificações do lote falharam com processos={processos}")
+        
+        passou = saidas[0] == saidas[2]
+        print(f"  {'✓ PASSOU' if passou else '✗ FALHOU'}: saída com pool igual à saída sem pool")
+        if not passou:
+            raise AssertionError("saída com pool diferente da saída sem pool")
+        
+        print("\n✅ Processamento em lote completado com sucesso!")
+    except Exception as e:
+        print(f"\n❌ Erro no Processamento em lote: {e}")
+        sys.exit(1)
+    
+    # Servidor HTTP
+    print("\n\n" + "█"*70)
+    print("█ FERRAMENTAS: Servidor HTTP")
+    print("█"*70)
+    try:
+        import asyncio
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        from servidor import Servidor
+        
+        async def requisitar(porta, requisicao):
+            reader, writer = await asyncio.open_connection('127.0.0.1', porta)
+            writer.write(requisicao.encode('latin-1'))
+            await writer.drain()
+            resposta = await reader.read()
+            writer.close()
+            cabecalho, _, corpo = resposta.partition(b'\r\n\r\n')
+            return int(cabecalho.split()[1]), json.loads(corpo)
+        
+        def get(alvo):
+            return f"GET {alvo} HTTP/1.1\r\nConnection: close\r\n\r\n"
+        
+        async def testar_servidor():
+            liberar = threading.Event()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Ocupa o único thread: os cálculos só começam após todas as requisições chegarem
+                executor.submit(liberar.wait)
+                servidor = Servidor(executor)
+                servidor_tcp = await asyncio.start_server(servidor.tratar_conexao, '127.0.0.1', 0)
+                porta = servidor_tcp.sockets[0].getsockname()[1]
+                
+                tarefas = [
+                    asyncio.ensure_future(requisitar(porta, get('/tabuleiro?n_casas=10')))
+                    for _ in range(10)
+                ]
+                for _ in range(500):
+                    if servidor.calculos + servidor.agrupadas == len(tarefas):
+                        break
+                    await asyncio.sleep(0.01)
+                liberar.set()
+                respostas = await asyncio.gather(*tarefas)
+                
+                _, saude = await requisitar(porta, get('/saude'))
+                status_nan, _ = await requisitar(
+                    porta,
+                    get('/beneficios?salario=nan&data_admissao=2023-01-15&data_demissao=2024-06-20')
+                )
+                status_tamanho, _ = await requisitar(
+                    porta, "GET /saude HTTP/1.1\r\nContent-Length: abc\r\n\r\n"
+                )
+                status_negativo, _ = await requisitar(
+                    porta, "GET /saude HTTP/1.1\r\nContent-Length: -1\r\n\r\n"
+                )
+                status_corpo, _ = await requisitar(
+                    porta, "GET /saude HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n"
+                )
+                status_linha, _ = await requisitar(porta, get('/saude?x=' + 'a' * 70_000))
+                status_cabecalho, _ = await requisitar(
+                    porta, "GET /saude HTTP/1.1\r\nX-Longo: " + 'a' * 70_000 + "\r\n\r\n"
+                )
+                
+                servidor_tcp.close()
+                await servidor_tcp.wait_closed()
+            return (
+                respostas, saude, status_nan, status_tamanho, status_negativo,
+                status_corpo, status_linha, status_cabecalho
+            )
+        
+        (
+            respostas, saude, status_nan, status_tamanho, status_negativo,
+            status_corpo, status_linha, status_cabecalho
+        ) = asyncio.run(testar_servidor())
+        
+        verificacoes = [
+            ("10 requisições idênticas respondidas",
+             all(status == 200 and corpo['combinacoes'] == 274 for status, corpo in respostas)),
+            (f"agrupadas em um cálculo (/saude: calculos={saude['calculos']}, agrupadas={saude['agrupadas']})",
+             saude['calculos'] == 1 and saude['agrupadas'] == 9),
+            ("salario=nan rejeitado com 400", status_nan == 400),
+            ("Content-Length não numérico rejeitado com 400", status_tamanho == 400),
+            ("Content-Length negativo rejeitado com 400", status_negativo == 400),
+            ("Content-Length acima do limite rejeitado com 413", status_corpo == 413),
+            ("Linha de requisição acima de 64 KiB rejeitada com 400", status_linha == 400),
+            ("Cabeçalho acima de 64 KiB rejeitado com 400", status_cabecalho == 400),
+        ]
+        
+        print("\nTestes executados:")
+        for descricao, passou in verificacoes:
+            print(f"  {'✓ PASSOU' if passou else '✗ FALHOU'}: {descricao}")
+        if not all(passou for _, passou in verificacoes):
+            raise AssertionError("verificações do servidor falharam")
+        
+        print("\n✅ Servidor HTTP completado com sucesso!")
+    except Exception as e:
+        print(f"\n❌ Erro no Servidor HTTP: {e}")
+        sys.exit(1)
+    
     # Resumo final
     print("\n\n" + "="*70)
     print("🎉 TODOS OS TESTES FORAM EXECUTADOS COM SUCESSO!")
@@ -120,11 +333,15 @@ def main():
     print("  • pergunta_2.py - Sequência Aritmética")
     print("  • pergunta_3.py - Jogo de Tabuleiro")
     print("  • pergunta_4.py - Cálculo de Benefícios")
+    print("  • instrumentacao.py - Métricas das perguntas")
+    print("  • processar_lote.py - Processamento em lote (NDJSON)")
+    print("  • servidor.py - Servidor HTTP das Perguntas 3 e 4")
     print("\nPara executar testes detalhados de cada pergunta:")
     print("  python pergunta_1.py")
     print("  python pergunta_2.py")
     print("  python pergunta_3.py")
     print("  python pergunta_4.py")
+    print("  python instrumentacao.py")
     print("="*70)
 
 
@@ -0,0 +1,337 @@
+"""
+Servidor HTTP local (asyncio, só biblioteca padrão) para as Perguntas 3 e 4
+
+Rotas (GET, respostas em JSON):
+    /tabuleiro?n_casas=10
+    /beneficios?salario=3000&data_admissao=2023-01-15&data_demissao=2024-06-20
+    /saude
+
+Características:
+- HTTP/1.1 com keep-alive (conexões reaproveitadas entre requisições)
+- Requisições idênticas em andamento são agrupadas em um único cálculo
+- `analisa_tabuleiro` roda em um pool de processos, sem bloquear o event loop
+
+Uso:
+    python servidor.py --porta 8080 --processos 4
+"""
+
+import argparse
+import asyncio
+import json
+import math
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import date
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from pergunta_3 import analisa_tabuleiro
+from pergunta_4 import calcular_beneficios_resultado
+
+TAMANHO_MAXIMO_LINHA = 8192
+MAXIMO_CABECALHOS = 100
+# As rotas não usam o corpo; ele é lido e descartado até este tamanho
+TAMANHO_MAXIMO_CORPO = 64 * 1024
+
+MENSAGENS_STATUS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+
+class ErroRequisicao(Exception):
+    """Erro que vira uma resposta HTTP com o status informado"""
+    
+    def __init__(self, status: int, mensagem: str) -> None:
+        super().__init__(mensagem)
+        self.status = status
+
+
+class Servidor:
+    """
+    Servidor HTTP das calculadoras com agrupamento de requisições.
+    
+    Args:
+        executor (Executor): Pool onde rodam as análises de tabuleiro
+        max_casas (int): Maior tabuleiro aceito
+        tempo_ocioso (float): Segundos até fechar uma conexão ociosa
+    """
+    
+    def __init__(self, executor: Executor, max_casas: int = 1000, tempo_ocioso: float = 30.0) -> None:
+        self.executor = executor
+        self.max_casas = max_casas
+        self.tempo_ocioso = tempo_ocioso
+        # chave normalizada -> cálculo em andamento
+        self._em_andamento: Dict[Tuple, asyncio.Future] = {}
+        self.calculos = 0
+        self.agrupadas = 0
+        self._rotas: Dict[str, Callable[[Dict[str, str]], Awaitable[dict]]] = {
+            '/tabuleiro': self._rota_tabuleiro,
+            '/beneficios': self._rota_beneficios,
+            '/saude': self._rota_saude,
+        }
+    
+    async def _agrupar(self, chave: Tuple, calcular: Callable[[], Awaitable]) -> object:
+        """
+        Executa o cálculo uma única vez para todas as requisições com a mesma chave.
+        
+        Args:
+            chave (Tuple): Identificação normalizada do cálculo
+            calcular (Callable[[], Awaitable]): Inicia o cálculo
+        
+        Returns:
+            object: Resultado do cálculo
+        """
+        futuro = self._em_andamento.get(chave)
+        if futuro is not None:
+            self.agrupadas += 1
+            return await asyncio.shield(futuro)
+        
+        futuro = asyncio.ensure_future(calcular())
+        self._em_andamento[chave] = futuro
+        futuro.add_done_callback(lambda _: self._em_andamento.pop(chave, None))
+        self.calculos += 1
+        return await asyncio.shield(futuro)
+    
+    async def _rota_tabuleiro(self, parametros: Dict[str, str]) -> dict:
+        n_casas = _parametro_int(parametros, 'n_casas')
+        if n_casas > self.max_casas:
+            raise ErroRequisicao(400, f"O tabuleiro deve ter no máximo {self.max_casas} casas")
+        
+        loop = asyncio.get_running_loop()
+        turnos, probabilidade, combinacoes = await self._agrupar(
+            ('tabuleiro', n_casas),
+            lambda: loop.run_in_executor(self.executor, analisa_tabuleiro, n_casas)
+        )
+        return {
+            'n_casas': n_casas,
+            'turnos': turnos,
+            'probabilidade': probabilidade,
+            'combinacoes': combinacoes
+        }
+    
+    async def _rota_beneficios(self, parametros: Dict[str, str]) -> dict:
+        salario = _parametro_float(parametros, 'salario')
+        data_admissao = _parametro_data(parametros, 'data_admissao')
+        data_demissao = _parametro_data(parametros, 'data_demissao')
+        
+        async def calcular():
+            # Cálculo de microssegundos: roda no próprio event loop
+            return calcular_beneficios_resultado(salario, data_admissao, data_demissao)
+        
+        resultado = await self._agrupar(
+            ('beneficios', salario, data_admissao.toordinal(), data_demissao.toordinal()),
+            calcular
+        )
+        return {
+            'valor_ferias': resultado.valor_ferias,
+            'valor_decimo': resultado.valor_decimo,
+            'detalhes': resultado.detalhes
+        }
+    
+    async def _rota_saude(self, parametros: Dict[str, str]) -> dict:
+        return {
+            'status': 'ok',
+            'calculos': self.calculos,
+            'agrupadas': self.agrupadas,
+            'em_andamento': len(self._em_andamento)
+        }
+    
+    async def tratar_conexao(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Atende as requisições de uma conexão até ela ser fechada.
+        
+        Args:
+            reader (asyncio.StreamReader): Leitura da conexão
+            writer (asyncio.StreamWriter): Escrita da conexão
+        """
+        try:
+            while True:
+                try:
+                    requisicao = await asyncio.wait_for(_ler_requisicao(reader), self.tempo_ocioso)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    return
+                except ErroRequisicao as e:
+                    _escrever_resposta(writer, e.status, {'erro': str(e)}, manter_conexao=False)
+                    await writer.drain()
+                    return
+                
+                if requisicao is None:
+                    return
+                
+                metodo, alvo, manter_conexao = requisicao
+                status, corpo = await self._responder(metodo, alvo)
+                _escrever_resposta(writer, status, corpo, manter_conexao)
+                await writer.drain()
+                if not manter_conexao:
+                    return
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    
+    async def _responder(self, metodo: str, alvo: str) -> Tuple[int, dict]:
+        """Direciona a requisição à rota e converte erros em status HTTP"""
+        url = urlsplit(alvo)
+        rota = self._rotas.get(url.path)
+        if rota is None:
+            return 404, {'erro': f"Rota não encontrada: {url.path}"}
+        
+        if metodo != 'GET':
+            return 405, {'erro': f"Método não permitido: {metodo}"}
+        
+        try:
+            return 200, await rota(dict(parse_qsl(url.query)))
+        except ErroRequisicao as e:
+            return e.status, {'erro': str(e)}
+        except ValueError as e:
+            return 400, {'erro': str(e)}
+        except Exception as e:
+            return 500, {'erro': f"{type(e).__name__}: {e}"}
+
+
+def _parametro_int(parametros: Dict[str, str], nome: str) -> int:
+    try:
+        return int(parametros[nome])
+    except KeyError:
+        raise ErroRequisicao(400, f"Parâmetro obrigatório: {nome}")
+    except ValueError:
+        raise ErroRequisicao(400, f"Parâmetro inválido: {nome}")
+
+
+def _parametro_float(parametros: Dict[str, str], nome: str) -> float:
+    try:
+        valor = float(parametros[nome])
+    except KeyError:
+        raise ErroRequisicao(400, f"Parâmetro obrigatório: {nome}")
+    except ValueError:
+        raise ErroRequisicao(400, f"Parâmetro inválido: {nome}")
+    # nan e inf seriam escritos como NaN/Infinity, que não são JSON válido
+    if not math.isfinite(valor):
+        raise ErroRequisicao(400, f"Parâmetro inválido: {nome}")
+    return valor
+
+
+def _parametro_data(parametros: Dict[str, str], nome: str) -> date:
+    try:
+        return date.fromisoformat(parametros[nome])
+    except KeyError:
+        raise ErroRequisicao(400, f"Parâmetro obrigatório: {nome}")
+    except ValueError:
+        raise ErroRequisicao(400, f"Parâmetro inválido (use AAAA-MM-DD): {nome}")
+
+
+async def _ler_requisicao(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bool]]:
+    """
+    Lê uma requisição HTTP/1.x.
+    
+    Returns:
+        Optional[Tuple[str, str, bool]]: Método, alvo e se a conexão deve
+            ser mantida; None se o cliente fechou a conexão
+    
+    Raises:
+        ErroRequisicao: Se a requisição for malformada
+    """
+    linha = await _ler_linha(reader)
+    if not linha:
+        return None
+    if len(linha) > TAMANHO_MAXIMO_LINHA:
+        raise ErroRequisicao(400, "Linha de requisição muito longa")
+    
+    try:
+        metodo, alvo, versao = linha.decode('latin-1').split()
+    except ValueError:
+        raise ErroRequisicao(400, "Linha de requisição malformada")
+    
+    cabecalhos = {}
+    for _ in range(MAXIMO_CABECALHOS + 1):
+        linha = await _ler_linha(reader)
+        if linha in (b'\r\n', b'\n', b''):
+            break
+        if len(linha) > TAMANHO_MAXIMO_LINHA:
+            raise ErroRequisicao(400, "Cabeçalho muito longo")
+        nome, _, valor = linha.decode('latin-1').partition(':')
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    else:
+        raise ErroRequisicao(400, "Cabeçalhos demais")
+    
+    # Descarta o corpo, se houver (as rotas usam apenas a query string)
+    try:
+        tamanho_corpo = int(cabecalhos.get('content-length', '0') or 0)
+    except ValueError:
+        raise ErroRequisicao(400, "Content-Length inválido")
+    if tamanho_corpo < 0:
+        raise ErroRequisicao(400, "Content-Length inválido")
+    if tamanho_corpo > TAMANHO_MAXIMO_CORPO:
+        raise ErroRequisicao(413, f"Corpo maior que {TAMANHO_MAXIMO_CORPO} bytes")
+    if tamanho_corpo:
+        await reader.readexactly(tamanho_corpo)
+    
+    conexao = cabecalhos.get('connection', '').lower()
+    if versao == 'HTTP/1.0':
+        manter_conexao = conexao == 'keep-alive'
+    else:
+        manter_conexao = conexao != 'close'
+    
+    return metodo, alvo, manter_conexao
+
+
+async def _ler_linha(reader: asyncio.StreamReader) -> bytes:
+    """Lê uma linha; acima do limite do StreamReader (64 KiB) vira erro 400"""
+    try:
+        return await reader.readline()
+    except (ValueError, asyncio.LimitOverrunError):
+        raise ErroRequisicao(400, "Linha maior que o limite de leitura")
+
+
+def _escrever_resposta(writer: asyncio.StreamWriter, status: int, corpo: dict, manter_conexao: bool) -> None:
+    dados = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+    cabecalho = (
+        f"HTTP/1.1 {status} {MENSAGENS_STATUS[status]}\r\n"
+        f"Content-Type: application/json; charset=utf-8\r\n"
+        f"Content-Length: {len(dados)}\r\n"
+        f"Connection: {'keep-alive' if manter_conexao else 'close'}\r\n"
+        f"\r\n"
+    )
+    writer.write(cabecalho.encode('latin-1') + dados)
+
+
+async def servir(host: str, porta: int, processos: Optional[int], max_casas: int) -> None:
+    """
+    Inicia o servidor e atende até ser interrompido.
+    
+    Args:
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta
+        processos (Optional[int]): Processos do pool (None usa o número de CPUs)
+        max_casas (int): Maior tabuleiro aceito
+    """
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        servidor = Servidor(executor, max_casas)
+        servidor_tcp = await asyncio.start_server(servidor.tratar_conexao, host, porta)
+        enderecos = ', '.join(str(s.getsockname()) for s in servidor_tcp.sockets)
+        print(f"Servidor ouvindo em {enderecos}")
+        async with servidor_tcp:
+            await servidor_tcp.serve_forever()
+
+
+def main() -> None:
+    """Interface de linha de comando do servidor"""
+    parser = argparse.ArgumentParser(description="Servidor HTTP das Perguntas 3 e 4")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8080)
+    parser.add_argument('--processos', type=int, default=None)
+    parser.add_argument('--max-casas', type=int, default=1000)
+    args = parser.parse_args()
+    
+    try:
+        asyncio.run(servir(args.host, args.porta, args.processos, args.max_casas))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()